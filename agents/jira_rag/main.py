@@ -1,7 +1,6 @@
 # SPDX-FileCopyrightText: 2025 Taras Paruta (partarstu@gmail.com)
 #
 # SPDX-License-Identifier: Apache-2.0
-import asyncio
 import time
 
 from pydantic_ai.mcp import MCPServerSSE
@@ -31,6 +30,8 @@ class JiraRagAgent(AgentBase):
     def __init__(self):
         self.issues_db = VectorDbService(RAG_COLLECTION)
         self.metadata_db = VectorDbService(METADATA_COLLECTION)
+        # Write-through cache of the metadata DB timestamps; this agent is their only writer
+        self._last_update_by_project: dict[str, str] = {}
 
         instruction_prompt = JiraRagUpdateSystemPrompt(valid_statuses=VALID_STATUSES)
 
@@ -73,12 +74,16 @@ class JiraRagAgent(AgentBase):
         Args:
             project_key: The key of the project for which the timestamp needs to be retrieved.
         """
+        if cached_timestamp := self._last_update_by_project.get(project_key):
+            return cached_timestamp
         try:
             project_new_id = self._key_to_int(project_key)
             points = await self.metadata_db.retrieve(point_ids=[project_new_id])
+            timestamp = DEFAULT_LAST_UPDATE
             if points and points[0].payload:
-                return points[0].payload.get("last_update", DEFAULT_LAST_UPDATE)
-            return DEFAULT_LAST_UPDATE
+                timestamp = points[0].payload.get("last_update", DEFAULT_LAST_UPDATE)
+            self._last_update_by_project[project_key] = timestamp
+            return timestamp
         except Exception:
             logger.exception("Error fetching last update")
             raise
@@ -93,6 +98,7 @@ class JiraRagAgent(AgentBase):
             timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(time.time() - EXECUTION_DELAY_SECONDS))
             metadata = ProjectMetadata(project_key=project_key, last_update=timestamp)
             await self.metadata_db.upsert(data=metadata)
+            self._last_update_by_project[project_key] = timestamp
             return "Timestamp saved."
         except Exception:
             logger.exception("Error saving last update")
@@ -105,8 +111,7 @@ class JiraRagAgent(AgentBase):
            issues: The list of Jira issues which need to be upserted.
         """
         try:
-            await self.issues_db.ensure_collection()
-            await asyncio.gather(*(self.issues_db.upsert(data=issue, ensure=False) for issue in issues))
+            await self.issues_db.upsert_many(data=issues)
             return f"Upserted {len(issues)} issues."
         except Exception:
             logger.exception("Error upserting issues")
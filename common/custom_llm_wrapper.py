@@ -1,4 +1,5 @@
 import json
+import logging
 import time
 from collections.abc import AsyncIterator, Sequence
 from contextlib import asynccontextmanager
@@ -90,7 +91,9 @@ class CustomLlmWrapper(WrapperModel):
         if config.PROMPT_INJECTION_CHECK_ENABLED:
             self._validate_for_prompt_injection(messages)
 
-        if messages and isinstance(messages[-1], ModelRequest):
+        # Both model loggers only emit DEBUG records, so skip the payload serialization entirely otherwise
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled and messages and isinstance(messages[-1], ModelRequest):
             self._log_model_request(messages[-1])
 
         actual_settings = self._get_model_settings(model_settings)
@@ -98,7 +101,8 @@ class CustomLlmWrapper(WrapperModel):
         response = await self.wrapped.request(messages, actual_settings, model_request_parameters)
         duration = time.monotonic() - start_time
         logger.info(f"LLM request to '{self.wrapped_model_name}' completed in {duration:.3f}s")
-        self._log_model_response(response)
+        if debug_enabled:
+            self._log_model_response(response)
         return response
 
     @asynccontextmanager
@@ -173,23 +177,21 @@ class CustomLlmWrapper(WrapperModel):
         return json.dumps(content, indent=2, default=CustomLlmWrapper._json_serializer)
 
     def _log_model_request(self, message):
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         if message.instructions and self.latest_instructions != message.instructions:
             self.latest_instructions = message.instructions
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             logger.debug(
                 f"[{timestamp}] Agent is using following instructions: "
                 f"\n{LOG_SEPARATOR}\n{self.latest_instructions}\n{LOG_SEPARATOR}"
             )
         for part in message.parts:
             if isinstance(part, ToolReturnPart):
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 payload = self._serialize_content(part.content)
                 logger.debug(
                     f"[{timestamp}] Agent is responding with the execution result of tool: "
                     f"'{part.tool_name}' with result: \n{LOG_SEPARATOR}\n{payload}\n{LOG_SEPARATOR}"
                 )
             elif isinstance(part, UserPromptPart):
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 if isinstance(part.content, str):
                     content_to_log = part.content
                 elif isinstance(part.content, Sequence):
@@ -207,12 +209,10 @@ class CustomLlmWrapper(WrapperModel):
                     f"\n{LOG_SEPARATOR}\n{content_to_log}\n{LOG_SEPARATOR}"
                 )
             elif isinstance(part, SystemPromptPart):
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 logger.debug(
                     f"[{timestamp}] Agent is using system prompt: \n{LOG_SEPARATOR}\n{part.content}\n{LOG_SEPARATOR}"
                 )
             elif isinstance(part, RetryPromptPart):
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 logger.debug(f"[{timestamp}] Agent is retrying prompting the model, the root cause: {part.content}")
 
     @staticmethod
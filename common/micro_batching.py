@@ -0,0 +1,49 @@
+# SPDX-FileCopyrightText: 2025 Taras Paruta (partarstu@gmail.com)
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+
+
+async def submit_to_batch[T, R](pending_items: asyncio.Queue[tuple[T, asyncio.Future[R]]], item: T) -> R:
+    """Queues the item for the next batch and waits for its own result."""
+    future = asyncio.get_running_loop().create_future()
+    await pending_items.put((item, future))
+    return await future
+
+
+async def process_in_micro_batches[T, R](
+    pending_items: asyncio.Queue[tuple[T, asyncio.Future[R]]],
+    process_batch: Callable[[list[T]], Awaitable[Sequence[R]]],
+    max_batch_size: int,
+    max_batch_wait_seconds: float,
+) -> None:
+    """
+    Collects queued items for up to max_batch_wait_seconds and processes each batch with a single call.
+
+    Runs until cancelled. process_batch must return one result per item, in order; if it raises, the exception is
+    set on every future of the batch.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await pending_items.get()]
+        deadline = loop.time() + max_batch_wait_seconds
+        try:
+            async with asyncio.timeout_at(deadline):
+                while len(batch) < max_batch_size:
+                    batch.append(await pending_items.get())
+        except TimeoutError:
+            pass
+
+        try:
+            results = await process_batch([item for item, _ in batch])
+            resolved = list(zip(batch, results, strict=True))
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            continue
+        for (_, future), result in resolved:
+            if not future.done():
+                future.set_result(result)
@@ -35,20 +35,19 @@ class VectorDbService:
         """Closes the shared HTTP client. Call this during application shutdown."""
         await self._http_client.aclose()
 
-    async def _get_embedding(self, text: str) -> list[float] | None:
+    async def _call_embedding_service(self, endpoint: str, payload: dict) -> dict:
         if not self.embedding_service_url:
             raise ValueError("EMBEDDING_SERVICE_URL is not configured.")
 
         max_retries = 3
-        logger.info(f"Calling embedding service (text length: {len(text)} chars)...")
         start = time.monotonic()
 
         for attempt in range(max_retries):
             try:
-                response = await self._http_client.post(f"{self.embedding_service_url}/embed", json={"text": text})
+                response = await self._http_client.post(f"{self.embedding_service_url}{endpoint}", json=payload)
                 response.raise_for_status()
                 logger.info(f"Embedding service call completed in {time.monotonic() - start:.3f}s")
-                return response.json()["embedding"]
+                return response.json()
             except (httpx.TimeoutException, httpx.ConnectError) as e:
                 if attempt == max_retries - 1:
                     logger.exception(
@@ -66,7 +65,17 @@ class VectorDbService:
             except Exception:
                 logger.exception("Error calling embedding service")
                 raise
-        return None
+        return {}
+
+    async def _get_embedding(self, text: str) -> list[float] | None:
+        logger.info(f"Calling embedding service (text length: {len(text)} chars)...")
+        response = await self._call_embedding_service("/embed", {"text": text})
+        return response["embedding"]
+
+    async def _get_embeddings(self, texts: list[str]) -> list[list[float]]:
+        logger.info(f"Calling embedding service (batch of {len(texts)} texts)...")
+        response = await self._call_embedding_service("/embed_batch", {"texts": texts})
+        return response["embeddings"]
 
     async def _collection_exists(self) -> bool:
         """Checks collection existence by listing all collections to avoid the /exists endpoint's empty-body issue."""
@@ -145,6 +154,29 @@ class VectorDbService:
             logger.exception("Error upserting to Vector DB")
             raise
 
+    async def upsert_many(self, data: list[VectorizableBaseModel], ensure: bool = True):
+        """Upserts several documents with a single Qdrant request.
+
+        Args:
+            data: The documents to upsert.
+            ensure: Whether to create the collection first if it doesn't exist.
+        """
+        if not data:
+            return
+        try:
+            if ensure:
+                await self.ensure_collection()
+            embeddings = await self._get_embeddings([item.get_embedding_content() for item in data])
+            points = [
+                models.PointStruct(id=item.get_vector_id(), vector=embedding, payload=item.model_dump())
+                for item, embedding in zip(data, embeddings, strict=True)
+            ]
+            await self.client.upsert(collection_name=self.collection_name, points=points)
+            logger.info(f"Upserted {len(points)} documents to collection {self.collection_name}")
+        except Exception:
+            logger.exception("Error upserting to Vector DB")
+            raise
+
     async def retrieve(self, point_ids: list[int | str]) -> list[models.Record]:
         """Retrieve points by their IDs from the collection.
 
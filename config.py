@@ -103,6 +103,8 @@ PROMPT_INJECTION_DETECTION_MODEL_NAME = os.environ.get(
     "PROMPT_INJECTION_MODEL_NAME", "ProtectAI/deberta-v3-base-prompt-injection-v2"
 )
 PROMPT_GUARD_SERVICE_URL = os.environ.get("PROMPT_GUARD_SERVICE_URL")
+PROMPT_GUARD_BATCH_MAX_SIZE = int(os.environ.get("PROMPT_GUARD_BATCH_MAX_SIZE", "32"))
+PROMPT_GUARD_BATCH_MAX_WAIT_SECONDS = float(os.environ.get("PROMPT_GUARD_BATCH_MAX_WAIT_SECONDS", "0.01"))
 
 
 # Orchestrator
@@ -112,6 +114,11 @@ class OrchestratorConfig:
     AGENTS_DISCOVERY_INTERVAL_SECONDS = 300
     TASK_EXECUTION_TIMEOUT = 500.0
     AGENT_DISCOVERY_TIMEOUT_SECONDS = 120
+    AGENT_DISCOVERY_PORT_PROBE_TIMEOUT_SECONDS = 1.0
+    AGENT_DISCOVERY_CONCURRENCY = int(os.environ.get("AGENT_DISCOVERY_CONCURRENCY", "32"))
+    AGENT_SELECTION_CACHE_TTL_SECONDS = 3600
+    INCIDENT_CREATION_CONCURRENCY = int(os.environ.get("INCIDENT_CREATION_CONCURRENCY", "10"))
+    TEST_GROUP_EXECUTION_TIMEOUT_SECONDS = float(os.environ.get("TEST_GROUP_EXECUTION_TIMEOUT_SECONDS", "14400"))
     INCOMING_REQUEST_WAIT_TIMEOUT = AGENT_DISCOVERY_TIMEOUT_SECONDS + 5
     MODEL_NAME = "google-gla:gemini-3-flash-preview"
     API_KEY = os.environ.get("ORCHESTRATOR_API_KEY")
@@ -218,6 +225,8 @@ class RetryConfig:
     RETRYABLE_STATUS_CODES = {404, 429, 500, 502, 503, 504}
     RETRY_BASE_DELAY_SECONDS = 5.0
     LLM_RESULTS_EXTRACTOR_RETRY_BASE_DELAY_SECONDS = 60.0
+    AGENT_RECOVERY_RETRY_BASE_DELAY_SECONDS = 30.0
+    AGENT_RECOVERY_RETRY_MAX_DELAY_SECONDS = 900.0
 
 
 class QdrantConfig:
@@ -232,6 +241,9 @@ class QdrantConfig:
     MAX_RESULTS = int(os.environ.get("RAG_MAX_RESULTS", "5"))
     EMBEDDING_MODEL = os.environ.get("RAG_EMBEDDING_MODEL", "Qwen/Qwen3-Embedding-0.6B")
     EMBEDDING_MODEL_PATH = os.path.join(LOCAL_MODELS_PATH, "embedding_model")
+    EMBEDDING_QUANTIZATION = os.environ.get("EMBEDDING_QUANTIZATION", "none").lower()
+    EMBEDDING_BATCH_MAX_SIZE = int(os.environ.get("EMBEDDING_BATCH_MAX_SIZE", "64"))
+    EMBEDDING_BATCH_MAX_WAIT_SECONDS = float(os.environ.get("EMBEDDING_BATCH_MAX_WAIT_SECONDS", "0.005"))
     EMBEDDING_SERVICE_URL = os.environ.get("EMBEDDING_SERVICE_URL")
     EMBEDDING_SERVICE_TIMEOUT_SECONDS = float(os.environ.get("EMBEDDING_SERVICE_TIMEOUT_SECONDS", "120.0"))
     VALID_STATUSES = os.environ.get(
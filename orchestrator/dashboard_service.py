@@ -6,6 +6,9 @@
 Dashboard service for aggregating orchestrator state for the Web UI.
 """
 
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
 from datetime import datetime
 from typing import Any
 
@@ -28,13 +31,51 @@ logger = utils.get_logger("orchestrator_dashboard")
 class OrchestratorDashboardService:
     """Service for providing dashboard data to the Web UI."""
 
-    def __init__(self, registry: AgentRegistry, tasks: TaskHistory, errors: ErrorHistory):
+    def __init__(
+        self, registry: AgentRegistry, tasks: TaskHistory, errors: ErrorHistory, cache_ttl_seconds: float = 2.0
+    ):
         self.registry = registry
         self.tasks = tasks
         self.errors = errors
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self._cache: dict[str, tuple[float, Any]] = {}  # key -> (monotonic time it was built, value)
+        self._pending_builds: dict[str, asyncio.Future[Any]] = {}  # key -> rebuild in progress
+
+    async def _get_cached(self, key: str, build: Callable[[], Awaitable[Any]]) -> Any:
+        """Return a recently built value for the key, rebuilding it once the TTL has passed.
+
+        Every open dashboard polls the same aggregates, so a short TTL lets concurrent viewers share one build.
+        Callers arriving while a rebuild is running await that same rebuild instead of starting their own.
+        """
+        cached = self._cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.cache_ttl_seconds:
+            return cached[1]
+        pending = self._pending_builds.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._build_and_cache(key, build))
+            self._pending_builds[key] = pending
+            pending.add_done_callback(lambda _: self._pending_builds.pop(key, None))
+        # Shielded so that one poller disconnecting doesn't cancel the build the others are waiting for
+        return await asyncio.shield(pending)
+
+    async def _build_and_cache(self, key: str, build: Callable[[], Awaitable[Any]]) -> Any:
+        built_at = time.monotonic()
+        value = await build()
+        self._cache[key] = (built_at, value)
+        return value
 
     async def get_summary(self) -> dict[str, Any]:
         """Returns high-level statistics for the dashboard."""
+        summary = dict(await self._get_cached("summary", self._build_summary_counts))
+
+        # Calculate uptime
+        uptime_seconds = int((datetime.now() - ORCHESTRATOR_START_TIME).total_seconds())
+        summary["orchestrator_start_time"] = ORCHESTRATOR_START_TIME.isoformat()
+        summary["uptime_seconds"] = uptime_seconds
+        summary["current_time"] = datetime.now().isoformat()
+        return summary
+
+    async def _build_summary_counts(self) -> dict[str, Any]:
         cards = await self.registry.get_all_cards()
         total_agents = len(cards)
         available = 0
@@ -59,9 +100,6 @@ class OrchestratorDashboardService:
         # Get error count
         all_errors = await self.errors.get_all()
 
-        # Calculate uptime
-        uptime_seconds = int((datetime.now() - ORCHESTRATOR_START_TIME).total_seconds())
-
         return {
             "agents_total": total_agents,
             "agents_available": available,
@@ -72,13 +110,13 @@ class OrchestratorDashboardService:
             "tasks_failed": failed_tasks,
             "tasks_total": len(all_tasks),
             "errors_total": len(all_errors),
-            "orchestrator_start_time": ORCHESTRATOR_START_TIME.isoformat(),
-            "uptime_seconds": uptime_seconds,
-            "current_time": datetime.now().isoformat(),
         }
 
     async def get_agents_status(self) -> list[dict[str, Any]]:
         """Returns detailed list of agents with their current state."""
+        return await self._get_cached("agents", self._build_agents_status)
+
+    async def _build_agents_status(self) -> list[dict[str, Any]]:
         cards = await self.registry.get_all_cards()
         result = []
 
@@ -115,8 +153,8 @@ class OrchestratorDashboardService:
 
     async def get_recent_tasks(self, limit: int = 50) -> list[dict[str, Any]]:
         """Returns recent tasks with their details."""
-        tasks = await self.tasks.get_all()
-        return [task.to_dict() for task in tasks[:limit]]
+        tasks = await self.tasks.get_recent(limit)
+        return [task.to_dict() for task in tasks]
 
     async def get_recent_errors(self, limit: int = 20) -> list[dict[str, Any]]:
         """Returns recent errors with context."""
@@ -153,12 +191,13 @@ class OrchestratorDashboardService:
                 if task.agent_logs:
                     result_entries.extend(self._parse_agent_logs(task.agent_logs, task.task_id, agent_id))
 
-        # If neither task_id nor agent_id is provided, return orchestrator logs only
+        # If neither task_id nor agent_id is provided, return orchestrator logs only (already newest first)
         else:
-            result_entries = memory_log_handler.get_logs(limit=100000, offset=0, level=level)
+            orchestrator_logs = memory_log_handler.get_logs(limit=limit, offset=offset, level=level)
+            return [entry.to_dict() for entry in orchestrator_logs]
 
-        # Filter by level if specified and we have agent logs
-        if level and (task_id or agent_id):
+        # Filter by level if specified
+        if level:
             level_upper = level.upper()
             result_entries = [log for log in result_entries if log.level == level_upper]
 
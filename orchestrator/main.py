@@ -4,17 +4,23 @@
 
 import asyncio
 import logging
+import random
+import sys
 import time
 import traceback
 from collections import defaultdict
-from contextlib import asynccontextmanager, suppress
+from collections.abc import Iterator
+from contextlib import asynccontextmanager, contextmanager, suppress
+from dataclasses import replace
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from urllib.parse import urlsplit
 from uuid import uuid4
 
 import httpx
 import uvicorn
-from a2a.client import ClientConfig, ClientFactory
+from a2a.client import Client, ClientConfig, ClientFactory
 from a2a.types import (
     AgentCard,
     Artifact,
@@ -33,7 +39,7 @@ from a2a.utils import get_message_text, new_agent_text_message
 from fastapi import Depends, FastAPI, HTTPException, Query, Request, Security
 from fastapi.security import APIKeyHeader
 from fastapi.staticfiles import StaticFiles
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 from pydantic_ai.exceptions import ModelHTTPError
 
 import config
@@ -60,6 +66,7 @@ from orchestrator.memory_log_handler import setup_memory_logging
 from orchestrator.models import (
     AgentStatus,
     BrokenReason,
+    CancellationRequest,
     ErrorRecord,
     TaskRecord,
     TaskStatus,
@@ -73,10 +80,24 @@ logger = utils.get_logger("orchestrator")
 # Set up memory logging for dashboard
 setup_memory_logging("orchestrator")
 
-execution_lock = asyncio.Lock()
+execution_locks_by_project: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)  # Serializes runs per project
 agent_selection_lock = asyncio.Lock()  # Ensures atomic agent selection and reservation
-cancellation_queue = asyncio.Queue()
+cancellation_queue: asyncio.Queue[CancellationRequest] = asyncio.Queue()
+_agents_pending_recovery: set[str] = set()  # Agents with a queued or scheduled recovery, to avoid duplicates
+orchestrator_http_client: httpx.AsyncClient | None = None  # Shared connection pool, opened in lifespan
 _results_extractor_semaphore = asyncio.Semaphore(1)  # Serializes extractor calls to avoid rate limit errors
+# Bounds incident creation requests across all concurrent runs to avoid overloading the incident creation agent
+_incident_creation_semaphore = asyncio.Semaphore(config.OrchestratorConfig.INCIDENT_CREATION_CONCURRENCY)
+_a2a_clients_by_agent: dict[str, tuple[AgentCard, Client]] = {}  # agent_id -> (card the client was built for, client)
+_agent_info_lines_cache: tuple[int, dict[str, str]] | None = None  # (registry version, agent_id -> info line)
+# (registry version, available agent IDs, task description) -> (monotonic time of selection, selected agent IDs)
+_agent_selection_cache: dict[tuple[int, frozenset[str], str], tuple[float, list[str]]] = {}
+_jira_events_in_progress: set[tuple[str, str]] = set()  # (endpoint path, issue key) of webhooks being processed
+
+_FAILED_TEST_STATUSES = frozenset({"failed", "error"})  # Execution statuses which require an incident
+# A2A task states after which the agent is done with the task
+_FINAL_TASK_STATES = frozenset({TaskState.completed, TaskState.failed, TaskState.rejected})
+_test_cases_adapter = TypeAdapter(list[TestCase])  # Serializes test case lists for agent prompts in one pass
 
 API_KEY_NAME = "X-API-Key"
 api_key_header = APIKeyHeader(name=API_KEY_NAME, auto_error=False)
@@ -99,10 +120,16 @@ class EndpointFilter(logging.Filter):
 # noinspection PyUnusedLocal
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    global orchestrator_http_client
+
     # Filter out dashboard polling logs from uvicorn access logger
     logging.getLogger("uvicorn.access").addFilter(EndpointFilter())
 
     logger.info("Orchestrator starting up...")
+    orchestrator_http_client = httpx.AsyncClient(
+        timeout=httpx.Timeout(config.OrchestratorConfig.TASK_EXECUTION_TIMEOUT),
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+    )
 
     # Perform initial agent discovery before accepting requests
     logger.info("Starting initial agent discovery...")
@@ -131,6 +158,8 @@ async def lifespan(app: FastAPI):
         except asyncio.CancelledError:
             logger.info("Cancellation retry task successfully cancelled.")
 
+    await orchestrator_http_client.aclose()
+
 
 def _validate_api_key(api_key: str = Security(api_key_header)):
     if config.OrchestratorConfig.API_KEY and api_key != config.OrchestratorConfig.API_KEY:
@@ -228,12 +257,15 @@ async def _retry_cancellation_task():
     """
     logger.info("Starting broken agent recovery task.")
     while True:
+        request = None
         try:
-            agent_id, timestamp = await cancellation_queue.get()
+            request = await cancellation_queue.get()
+            agent_id = request.agent_id
 
             # If it's been more than 24 hours, give up
-            if time.time() - timestamp > 24 * 3600:
+            if time.monotonic() - request.broken_since > 24 * 3600:
                 logger.warning(f"Gave up recovering agent {agent_id} after 24 hours.")
+                _agents_pending_recovery.discard(agent_id)
                 cancellation_queue.task_done()
                 continue
 
@@ -242,6 +274,7 @@ async def _retry_cancellation_task():
 
             if not agent_card:
                 logger.warning(f"Agent {agent_id} no longer has a registered card. Skipping recovery.")
+                _agents_pending_recovery.discard(agent_id)
                 cancellation_queue.task_done()
                 continue
 
@@ -260,7 +293,7 @@ async def _retry_cancellation_task():
             elif broken_reason == BrokenReason.TASK_STUCK:
                 # For TASK_STUCK agents: attempt to cancel the stuck task first
                 if stuck_task_id:
-                    cancel_success = await _cancel_agent_task(agent_card, stuck_task_id)
+                    cancel_success = await _cancel_agent_task(agent_id, agent_card, stuck_task_id)
                     if cancel_success:
                         logger.info(f"Successfully cancelled stuck task {stuck_task_id} on agent {agent_id}.")
                         is_recovered = True
@@ -291,24 +324,48 @@ async def _retry_cancellation_task():
             if is_recovered:
                 logger.info(f"Agent {agent_id} successfully recovered. Marking AVAILABLE.")
                 await agent_registry.update_status(agent_id, AgentStatus.AVAILABLE)
+                _agents_pending_recovery.discard(agent_id)
                 cancellation_queue.task_done()
             else:
-                logger.info(f"Agent {agent_id} not recovered yet. Will retry in 60 seconds.")
+                retry_delay = _get_recovery_retry_delay(request.attempt)
+                logger.info(f"Agent {agent_id} not recovered yet. Will retry in {retry_delay:.0f} seconds.")
                 cancellation_queue.task_done()
-                await asyncio.sleep(60)
-                await cancellation_queue.put((agent_id, timestamp))
+                # Re-queue via a timer so the consumer stays blocked on get() and other agents aren't held up
+                asyncio.get_running_loop().call_later(
+                    retry_delay, cancellation_queue.put_nowait, replace(request, attempt=request.attempt + 1)
+                )
 
         except asyncio.CancelledError:
             break
         except Exception:
             logger.exception("Error in broken agent recovery task.")
+            if request:
+                # The request is dropped, so let a later failure queue the agent again
+                _agents_pending_recovery.discard(request.agent_id)
             await asyncio.sleep(5)
 
 
-async def _cancel_agent_task(agent_card: AgentCard, task_id: str) -> bool:
+def _enqueue_agent_recovery(agent_id: str) -> None:
+    """Queue a broken agent for recovery unless a recovery for it is already queued or scheduled."""
+    if agent_id in _agents_pending_recovery:
+        return
+    _agents_pending_recovery.add(agent_id)
+    cancellation_queue.put_nowait(CancellationRequest(agent_id, time.monotonic()))
+
+
+def _get_recovery_retry_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter, so retries for agents that broke together don't fire in lockstep."""
+    max_delay = config.RetryConfig.AGENT_RECOVERY_RETRY_MAX_DELAY_SECONDS
+    # Cap the exponent so long outages don't build huge integers; the delay is clamped to max_delay anyway
+    backoff = config.RetryConfig.AGENT_RECOVERY_RETRY_BASE_DELAY_SECONDS * 2 ** min(attempt, 16)
+    return random.uniform(0, min(max_delay, backoff))
+
+
+async def _cancel_agent_task(agent_id: str, agent_card: AgentCard, task_id: str) -> bool:
     """Attempt to cancel a task on an agent using the A2A protocol.
 
     Args:
+        agent_id: The ID of the agent in the registry.
         agent_card: The agent's card containing connection info.
         task_id: The ID of the task to cancel.
 
@@ -316,26 +373,24 @@ async def _cancel_agent_task(agent_card: AgentCard, task_id: str) -> bool:
         True if cancellation was successful or acknowledged, False otherwise.
     """
     try:
-        async with httpx.AsyncClient(timeout=config.OrchestratorConfig.AGENT_DISCOVERY_TIMEOUT_SECONDS) as client:
-            client_config = ClientConfig(httpx_client=client)
-            client_factory = ClientFactory(config=client_config)
-            a2a_client = client_factory.create(card=agent_card)
-
+        a2a_client = _get_a2a_client(agent_id, agent_card)
+        # The shared HTTP client is tuned for long task runs, so cap the cancel call separately
+        async with asyncio.timeout(config.OrchestratorConfig.AGENT_DISCOVERY_TIMEOUT_SECONDS):
             cancelled_task = await a2a_client.cancel_task(TaskIdParams(id=task_id))
 
-            # Check if cancellation was accepted
-            if not cancelled_task.status:
-                logger.warning(f"Task got no status, artefacts: {cancelled_task.artifacts}")
-                return False
-            if cancelled_task.status.state != TaskState.canceled:
-                logger.warning(
-                    f"Task cancellation failed: got status {cancelled_task.status.state} and "
-                    f"message {cancelled_task.status.message}"
-                )
-                return False
+        # Check if cancellation was accepted
+        if not cancelled_task.status:
+            logger.warning(f"Task got no status, artefacts: {cancelled_task.artifacts}")
+            return False
+        if cancelled_task.status.state != TaskState.canceled:
+            logger.warning(
+                f"Task cancellation failed: got status {cancelled_task.status.state} and "
+                f"message {cancelled_task.status.message}"
+            )
+            return False
 
-            logger.info(f"Task {task_id} cancellation request sent successfully.")
-            return True
+        logger.info(f"Task {task_id} cancellation request sent successfully.")
+        return True
 
     except Exception as e:
         logger.warning(f"Failed to cancel task {task_id}: {e}")
@@ -372,6 +427,8 @@ multi_discovery_agent = CustomLlmWrapper.create_agent(
 
 
 # --- For mapping between input in unknown format and output in structured format ---
+# Cached per output type: the agent configuration is otherwise identical, so rebuilding it per call is wasted work
+@lru_cache(maxsize=32)
 def _get_results_extractor_agent(output_type: type[JsonSerializableModel] | type[str]):
     return CustomLlmWrapper.create_agent(
         model_name=config.OrchestratorConfig.MODEL_NAME,
@@ -438,11 +495,16 @@ async def review_jira_requirements(request: Request, api_key: str = Depends(_val
     try:
         logger.info("Received an event from Jira, requesting requirements review from an agent.")
         user_story_id = await _get_jira_issue_key_from_request(request)
-        task_description = "Review the Jira user story"
-        completed_task = await _send_task_to_agent(f"Jira user story with key {user_story_id}", task_description)
-        _validate_task_status(completed_task, f"Review of the user story {user_story_id}")
-        logger.info("Received response from an agent, requirements review seems to be complete.")
-        return {"message": f"Review of the requirements for Jira user story {user_story_id} completed."}
+        with _jira_event_processing(request.url.path, user_story_id) as is_duplicate:
+            if is_duplicate:
+                return {
+                    "message": f"Review of the requirements for Jira user story {user_story_id} is already running."
+                }
+            task_description = "Review the Jira user story"
+            completed_task = await _send_task_to_agent(f"Jira user story with key {user_story_id}", task_description)
+            _validate_task_status(completed_task, f"Review of the user story {user_story_id}")
+            logger.info("Received response from an agent, requirements review seems to be complete.")
+            return {"message": f"Review of the requirements for Jira user story {user_story_id} completed."}
     except HTTPException:
         raise
     except Exception as e:
@@ -458,21 +520,28 @@ async def trigger_test_case_generation_workflow(request: Request, api_key: str =
     try:
         logger.info("Received an event from Jira, requesting test case generation from an agent.")
         user_story_id = await _get_jira_issue_key_from_request(request)
-        generated_test_cases = await _request_test_cases_generation(user_story_id)
-        if not generated_test_cases:
-            _handle_exception("Test case generation agent responded provided no generated test cases in its response.")
+        with _jira_event_processing(request.url.path, user_story_id) as is_duplicate:
+            if is_duplicate:
+                return {"message": f"Test case generation for Jira user story {user_story_id} is already running."}
+            generated_test_cases = await _request_test_cases_generation(user_story_id)
+            if not generated_test_cases:
+                _handle_exception(
+                    "Test case generation agent responded provided no generated test cases in its response."
+                )
 
-        logger.info(
-            f"Got {len(generated_test_cases.test_cases)} generated test cases, requesting their classification."
-        )
-        await _request_test_cases_classification(generated_test_cases.test_cases, user_story_id)
-        logger.info("Received response from an agent, test case classification seems to be complete.")
+            logger.info(
+                f"Got {len(generated_test_cases.test_cases)} generated test cases, requesting their classification."
+            )
+            await _request_test_cases_classification(generated_test_cases.test_cases, user_story_id)
+            logger.info("Received response from an agent, test case classification seems to be complete.")
 
-        logger.info("Requesting review of all generated test cases.")
-        await _request_test_cases_review(generated_test_cases.test_cases, user_story_id)
-        logger.info("Received response from an agent, test case review seems to be complete.")
+            logger.info("Requesting review of all generated test cases.")
+            await _request_test_cases_review(generated_test_cases.test_cases, user_story_id)
+            logger.info("Received response from an agent, test case review seems to be complete.")
 
-        return {"message": f"Test case generation and classification for Jira user story {user_story_id} completed."}
+            return {
+                "message": f"Test case generation and classification for Jira user story {user_story_id} completed."
+            }
     except HTTPException:
         raise
     except Exception as e:
@@ -511,8 +580,8 @@ async def update_rag_db(request: ProjectExecutionRequest, api_key: str = Depends
 # noinspection PyUnusedLocal
 @orchestrator_app.post("/execute-tests")
 async def execute_tests(request: ProjectExecutionRequest, api_key: str = Depends(_validate_api_key)):
-    async with execution_lock:
-        project_key = request.project_key
+    project_key = request.project_key
+    async with execution_locks_by_project[project_key]:
         logger.info(f"Received request to execute automated tests for project '{project_key}'.")
         test_management_client = get_test_management_client()
         automated_test_cases = []
@@ -531,7 +600,7 @@ async def execute_tests(request: ProjectExecutionRequest, api_key: str = Depends
             f"Retrieved {len(automated_test_cases)} test cases for automatic execution, grouping them by labels "
             f"and requesting execution for each group."
         )
-        grouped_test_cases = await _group_test_cases_by_labels(automated_test_cases)
+        grouped_test_cases = _group_test_cases_by_labels(automated_test_cases)
         if not grouped_test_cases:
             logger.info("No tests found which can be automated based on the label.")
             return {"message": f"No test cases with '{config.OrchestratorConfig.AUTOMATED_TC_LABEL}' label found."}
@@ -577,7 +646,7 @@ async def _request_incident_creation_for_failed_tests(
     Args:
         all_execution_results: List of all test execution results to process.
     """
-    failed_results = [result for result in all_execution_results if result.testExecutionStatus in ["failed", "error"]]
+    failed_results = [result for result in all_execution_results if result.testExecutionStatus in _FAILED_TEST_STATUSES]
 
     if not failed_results:
         logger.info("No failed tests found. Skipping incident creation.")
@@ -587,48 +656,72 @@ async def _request_incident_creation_for_failed_tests(
 
     async def _create_incident_for_result(result: TestExecutionResult) -> None:
         """Helper coroutine to create incident for a single failed test result."""
-        logger.info(f"Test case {result.testCaseKey} failed. Initiating incident creation.")
-        try:
-            incident_input = IncidentCreationInput(
-                test_case=result.test_case,
-                test_execution_result=str(result.generalErrorMessage),
-                test_step_results=result.stepResults,
-                system_description=result.system_description,
-                issue_priority_field_id=config.IncidentCreationAgentConfig.ISSUE_PRIORITY_FIELD_ID,
-            )
+        async with _incident_creation_semaphore:
+            logger.info(f"Test case {result.testCaseKey} failed. Initiating incident creation.")
+            try:
+                incident_input = IncidentCreationInput(
+                    test_case=result.test_case,
+                    test_execution_result=result.generalErrorMessage,
+                    test_step_results=result.stepResults,
+                    system_description=result.system_description,
+                    issue_priority_field_id=config.IncidentCreationAgentConfig.ISSUE_PRIORITY_FIELD_ID,
+                )
 
-            incident_result = await _request_incident_creation(incident_input, result.artifacts or [])
-            result.incident_creation_result = incident_result
-            logger.info(
-                f"Incident creation completed for test case {result.testCaseKey}. "
-                f"Incident key: {incident_result.incident_key if incident_result else 'N/A'}"
-            )
-        except Exception:
-            _record_error(f"Failed to create incident for test case {result.testCaseKey}.")
+                incident_result = await _request_incident_creation(incident_input, result.artifacts or [])
+                result.incident_creation_result = incident_result
+                logger.info(
+                    f"Incident creation completed for test case {result.testCaseKey}. "
+                    f"Incident key: {incident_result.incident_key if incident_result else 'N/A'}"
+                )
+            except Exception:
+                _record_error(f"Failed to create incident for test case {result.testCaseKey}.")
 
-    # Execute all incident creations in parallel
+    # Execute incident creations in parallel, bounded to avoid overloading the incident creation agent
     await asyncio.gather(*[_create_incident_for_result(result) for result in failed_results])
 
 
 async def _request_all_test_cases_execution(grouped_test_cases):
     label_to_agents_map = await _select_execution_agents_for_each_test_label(list(grouped_test_cases.keys()))
-    execution_tasks = []
+    execution_tasks: dict[asyncio.Task, str] = {}
     for label, test_cases in grouped_test_cases.items():
         agent_ids = label_to_agents_map.get(label)
         if agent_ids:
-            execution_tasks.append(_execute_test_group(label, test_cases, agent_ids))
+            execution_tasks[asyncio.create_task(_execute_test_group(label, test_cases, agent_ids))] = label
         else:
             logger.warning(f"Skipping execution of test cases for label '{label}' as no suitable agents were found.")
-    execution_results_nested = await asyncio.gather(*execution_tasks)
-    all_execution_results = [result for group_results in execution_results_nested for result in group_results]
+    if not execution_tasks:
+        return []
+
+    try:
+        # A hung group must not hold back the results of all the others
+        done, pending = await asyncio.wait(
+            execution_tasks, timeout=config.OrchestratorConfig.TEST_GROUP_EXECUTION_TIMEOUT_SECONDS
+        )
+        for task in pending:
+            _record_error(f"Execution of test cases for label '{execution_tasks[task]}' timed out and was cancelled.")
+    finally:
+        # Also reached when the caller is cancelled, so that no group keeps running on its own
+        unfinished_tasks = [task for task in execution_tasks if not task.done()]
+        for task in unfinished_tasks:
+            task.cancel()
+        if unfinished_tasks:
+            await asyncio.wait(unfinished_tasks)
+
+    all_execution_results = []
+    for task in done:
+        if task.exception():
+            _record_error(f"Execution of test cases for label '{execution_tasks[task]}' failed: {task.exception()}")
+        else:
+            all_execution_results.extend(task.result())
     return all_execution_results
 
 
-async def _group_test_cases_by_labels(automated_test_cases):
+def _group_test_cases_by_labels(automated_test_cases: list[TestCase]) -> dict[str, list[TestCase]]:
+    automated_tc_label = config.OrchestratorConfig.AUTOMATED_TC_LABEL
     grouped_test_cases = defaultdict(list)
     for tc in automated_test_cases:
         for label in tc.labels:
-            if label != config.OrchestratorConfig.AUTOMATED_TC_LABEL:
+            if label != automated_tc_label:
                 grouped_test_cases[label].append(tc)
     return grouped_test_cases
 
@@ -658,14 +751,9 @@ async def _execute_test_group(
     test_type: str, test_cases: list[TestCase], agent_ids: list[str]
 ) -> list[TestExecutionResult]:
     # Filter agents that are actually in the registry
-    valid_agent_ids = []
-    for aid in agent_ids:
-        if await agent_registry.contains(aid):
-            valid_agent_ids.append(aid)
-
-    agent_names = []
-    for aid in valid_agent_ids:
-        agent_names.append(await agent_registry.get_name(aid))
+    names_by_id = await agent_registry.get_names(agent_ids)
+    valid_agent_ids = [aid for aid in agent_ids if aid in names_by_id]
+    agent_names = [names_by_id[aid] for aid in valid_agent_ids]
 
     logger.info(f"Starting execution of {len(test_cases)} tests for type: '{test_type}' using agents: {agent_names}")
 
@@ -677,37 +765,42 @@ async def _execute_test_group(
     for tc in test_cases:
         queue.put_nowait((tc, test_type))
 
-    results: list[TestExecutionResult] = []
     workers = []
     for agent_id in valid_agent_ids:
-        workers.append(asyncio.create_task(_agent_worker(agent_id, queue, results, valid_agent_ids)))
+        workers.append(asyncio.create_task(_agent_worker(agent_id, queue, valid_agent_ids)))
 
-    # Wait for all items in the queue to be processed
-    await queue.join()
+    try:
+        # Wait for all items in the queue to be processed
+        await queue.join()
+    except asyncio.CancelledError:
+        # Don't leave workers running against agents once the group has been abandoned
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        raise
 
     # Signal all workers to stop
     for _ in workers:
         queue.put_nowait(None)
 
-    # Wait for workers to finish gracefully
-    await asyncio.gather(*workers)
+    # Wait for workers to finish gracefully; each one collects its own results
+    per_worker_results = await asyncio.gather(*workers)
 
-    return results
+    return [result for worker_results in per_worker_results for result in worker_results]
 
 
-async def _agent_worker(
-    agent_id: str, queue: asyncio.Queue, results: list[TestExecutionResult], pool_agent_ids: list[str]
-):
+async def _agent_worker(agent_id: str, queue: asyncio.Queue, pool_agent_ids: list[str]) -> list[TestExecutionResult]:
     logger.info(f"Agent worker started for agent {agent_id}")
+    results: list[TestExecutionResult] = []
     try:
+        # Each worker is pinned to one agent, so its name is resolved only once
+        agent_name = await agent_registry.get_name(agent_id)
         while True:
-            status = await agent_registry.get_status(agent_id)
-            if status != AgentStatus.AVAILABLE:
-                if status == AgentStatus.BROKEN:
-                    logger.warning(f"Agent {agent_id} is BROKEN. Worker stopping.")
-                    break
-                await asyncio.sleep(1)
-                continue
+            # Woken by registry status changes instead of polling while the agent is BUSY
+            status = await agent_registry.wait_for_status(agent_id, (AgentStatus.AVAILABLE, AgentStatus.BROKEN))
+            if status == AgentStatus.BROKEN:
+                logger.warning(f"Agent {agent_id} is BROKEN. Worker stopping.")
+                break
 
             item = await queue.get()
             if item is None:
@@ -717,7 +810,7 @@ async def _agent_worker(
 
             test_case, test_type = item
             try:
-                result = await _execute_single_test(agent_id, test_case, test_type)
+                result = await _execute_single_test(agent_name, test_case, test_type)
                 if result:
                     results.append(result)
             except Exception as e:
@@ -726,13 +819,8 @@ async def _agent_worker(
                 await agent_registry.update_status(agent_id, AgentStatus.BROKEN, BrokenReason.TASK_STUCK)
 
                 # Check if any other agents in the pool are still alive (not BROKEN)
-                any_agents_alive = False
-                for other_id in pool_agent_ids:
-                    if other_id != agent_id:
-                        status = await agent_registry.get_status(other_id)
-                        if status != AgentStatus.BROKEN:
-                            any_agents_alive = True
-                            break
+                other_statuses = await agent_registry.get_statuses(aid for aid in pool_agent_ids if aid != agent_id)
+                any_agents_alive = any(status != AgentStatus.BROKEN for status in other_statuses.values())
 
                 if any_agents_alive:
                     # Retry logic: Put back in queue
@@ -743,15 +831,15 @@ async def _agent_worker(
                     logger.error(
                         f"All agents for this group are broken. Returning failed result for test case {test_case.key}."
                     )
-                    agent_name = await agent_registry.get_name(agent_id)
+                    failure_timestamp = datetime.now().isoformat()
                     failed_result = TestExecutionResult(
                         stepResults=[],
                         testCaseKey=test_case.key,
                         testCaseName=test_case.name,
                         testExecutionStatus="error",
                         generalErrorMessage=f"All agents failed. Last error from {agent_name}: {e}",
-                        start_timestamp=datetime.now().isoformat(),
-                        end_timestamp=datetime.now().isoformat(),
+                        start_timestamp=failure_timestamp,
+                        end_timestamp=failure_timestamp,
                         system_description=f"Agent: {agent_name} (Failed - No Retry Available)",
                         test_case=test_case,
                     )
@@ -764,32 +852,41 @@ async def _agent_worker(
         logger.info(f"Agent worker for {agent_id} cancelled.")
     except Exception as e:
         _record_error(f"Unexpected error in agent worker {agent_id}: {e}")
+    return results
 
 
-async def _execute_single_test(agent_id: str, test_case: TestCase, test_type: str) -> TestExecutionResult | None:
+async def _execute_single_test(agent_name: str, test_case: TestCase, test_type: str) -> TestExecutionResult | None:
     task_description = f"Execution of test case {test_case.key} (type: {test_type})"
     execution_request = TestExecutionRequest(test_case=test_case)
     artifacts = []
-    start_timestamp = datetime.now()
+    # Raw epoch seconds; they're only formatted if the agent's result lacks its own timestamps
+    start_time = time.time()
     try:
         completed_task = await _send_task_to_agent(execution_request.model_dump_json(), task_description)
         artifacts = _get_artifacts_from_task(completed_task, task_description)
     except Exception as e:
         _handle_exception(f"Failed to execute test case {test_case.key}. Error: {e}", 500)
     finally:
-        end_timestamp = datetime.now()
+        end_time = time.time()
 
-    agent_name = await agent_registry.get_name(agent_id)
     if not artifacts:
         _handle_exception(f"No test case execution results received from agent {agent_name}", 500)
     text_parts = _get_text_content_from_artifacts(artifacts, task_description)
     text_results = "\n".join(text_parts)
-    user_prompt = f"""
+    try:
+        # Agents usually return the result already in the expected schema, which makes the LLM extraction redundant
+        test_execution_result = TestExecutionResult.model_validate_json(text_results)
+        logger.debug(f"Parsed execution results of test case {test_case.key} directly from the agent response.")
+    except ValidationError:
+        test_execution_result = None
+    try:
+        if not test_execution_result:
+            logger.debug(f"Extracting execution results of test case {test_case.key} with the LLM.")
+            user_prompt = f"""
 Test case execution results:\n```{text_results}```
 """
-    try:
-        async with _results_extractor_semaphore:
-            test_execution_result = await _run_results_extractor_with_retry(user_prompt)
+            async with _results_extractor_semaphore:
+                test_execution_result = await _run_results_extractor_with_retry(user_prompt)
         if not test_execution_result:
             raise ValueError("Couldn't map the test execution results received from the agent to the expected format.")
     except Exception as e:
@@ -800,17 +897,17 @@ Test case execution results:\n```{text_results}```
             testCaseName=test_case.name,
             testExecutionStatus="error",
             generalErrorMessage=f"Failed to extract test results: {e}",
-            start_timestamp=start_timestamp.isoformat(),
-            end_timestamp=end_timestamp.isoformat(),
+            start_timestamp=datetime.fromtimestamp(start_time).isoformat(),
+            end_timestamp=datetime.fromtimestamp(end_time).isoformat(),
             system_description=f"Agent: {agent_name}, Environment: Standard Test Environment",
             test_case=test_case,
         )
 
     test_execution_result.testCaseKey = test_case.key
     if not test_execution_result.start_timestamp:
-        test_execution_result.start_timestamp = start_timestamp.isoformat()
+        test_execution_result.start_timestamp = datetime.fromtimestamp(start_time).isoformat()
     if not test_execution_result.end_timestamp:
-        test_execution_result.end_timestamp = end_timestamp.isoformat()
+        test_execution_result.end_timestamp = datetime.fromtimestamp(end_time).isoformat()
     # Extract file artifacts from agent response - logs are included as file parts by the agent
     file_artifacts = _get_file_contents_from_artifacts(artifacts)
     test_execution_result.artifacts = file_artifacts
@@ -897,14 +994,16 @@ def _get_artifacts_from_task(task: Task, task_description: str) -> list[Artifact
 
 async def _request_test_cases_classification(test_cases: list[TestCase], user_story_id: str) -> list[Artifact]:
     task_description = "Classify test cases"
-    completed_task = await _send_task_to_agent(f"Test cases:\n{test_cases}", task_description)
+    test_cases_json = _test_cases_adapter.dump_json(test_cases).decode()
+    completed_task = await _send_task_to_agent(f"Test cases:\n{test_cases_json}", task_description)
     return _get_artifacts_from_task(completed_task, f"Classification of test cases for the user story {user_story_id}")
 
 
 async def _request_test_cases_review(test_cases: list[TestCase], user_story_id: str) -> list[Artifact]:
     task_description = "Review test cases"
+    test_cases_json = _test_cases_adapter.dump_json(test_cases).decode()
     completed_task = await _send_task_to_agent(
-        f"Test cases:\n{test_cases}\nUser Story ID: {user_story_id}", task_description
+        f"Test cases:\n{test_cases_json}\nUser Story ID: {user_story_id}", task_description
     )
     return _get_artifacts_from_task(completed_task, "Review of test cases")
 
@@ -947,12 +1046,13 @@ def _get_text_content_from_artifacts(
     Raises:
         HTTPException: If any_content_expected is True and no text content is found.
     """
-    text_parts: list[str] = []
-    if artifacts:
-        for artifact in artifacts:
-            for part in artifact.parts:
-                if isinstance(part.root, TextPart) and part.root.text:
-                    text_parts.append(part.root.text)
+    # Exact type checks are enough here: part roots are concrete a2a models, never subclasses
+    text_parts = [
+        part.root.text
+        for artifact in artifacts or ()
+        for part in artifact.parts
+        if type(part.root) is TextPart and part.root.text
+    ]
     if any_content_expected and not text_parts:
         _handle_exception(f"Received no text results from the agent after it executed {task_description}.")
 
@@ -1003,30 +1103,36 @@ def _get_model_from_artifacts[T: JsonSerializableModel](
 
 
 def _get_file_contents_from_artifacts(artifacts: list[Artifact] | None) -> list[FileWithBytes]:
-    file_parts: list[FileWithBytes] = []
-    if not artifacts:
-        return file_parts
-    for artifact in artifacts:
-        for part in artifact.parts:
-            if isinstance(part.root, FilePart):
-                file_parts.append(part.root.file)
-    return file_parts
+    return [part.root.file for artifact in artifacts or () for part in artifact.parts if type(part.root) is FilePart]
 
 
-async def _save_agent_logs_from_task(task: Task, internal_task_id: str) -> None:
-    """Extract and save agent logs from task artifacts.
+def _get_agent_logs_from_task(task: Task, internal_task_id: str) -> list[str] | None:
+    """Extract agent logs from task artifacts.
 
     Args:
         task: The completed Task containing artifacts with potential logs.
-        internal_task_id: The internal task ID for tracking in task history.
+        internal_task_id: The internal task ID, used for logging.
+
+    Returns:
+        The agent logs, or None if the task has no logs or they couldn't be extracted.
     """
     try:
         file_artifacts = _get_file_contents_from_artifacts(task.artifacts)
-        agent_logs = utils.get_execution_logs_from_artifacts(file_artifacts)
-        if agent_logs:
-            await task_history.update_logs(internal_task_id, agent_logs)
+        return utils.get_execution_logs_from_artifacts(file_artifacts) or None
     except Exception as e:
         logger.warning(f"Failed to extract logs for task {internal_task_id}: {e}")
+        return None
+
+
+def _get_a2a_client(agent_id: str, agent_card: AgentCard) -> Client:
+    """Return the A2A client for the agent, rebuilding it only when its registered card has been replaced."""
+    cached = _a2a_clients_by_agent.get(agent_id)
+    if cached and cached[0] is agent_card:
+        return cached[1]
+    client_factory = ClientFactory(config=ClientConfig(httpx_client=orchestrator_http_client))
+    a2a_client = client_factory.create(card=agent_card)
+    _a2a_clients_by_agent[agent_id] = (agent_card, a2a_client)
+    return a2a_client
 
 
 async def _send_task_to_agent_with_message(message: Message, task_description: str) -> Task | None:
@@ -1042,11 +1148,12 @@ async def _send_task_to_agent_with_message(message: Message, task_description: s
 
     internal_task_id = str(uuid4())
     agent_id = None
+    last_task = None
     try:
         # Wait for an agent and reserve it atomically
         agent_id, agent_card = await reserve_agent_waiting_if_needed(task_description, internal_task_id)
         task_start_time = datetime.now()
-        agent_name = await agent_registry.get_name(agent_id)
+        agent_name = agent_card.name
 
         # Record task start in history
         task_record = TaskRecord(
@@ -1060,122 +1167,115 @@ async def _send_task_to_agent_with_message(message: Message, task_description: s
         await task_history.add(task_record)
         await agent_registry.set_current_task(agent_id, internal_task_id)
 
-        async with httpx.AsyncClient(timeout=config.OrchestratorConfig.TASK_EXECUTION_TIMEOUT) as client:
-            client_config = ClientConfig(httpx_client=client)
-            client_factory = ClientFactory(config=client_config)
-            a2a_client = client_factory.create(card=agent_card)
-
-            response_iterator = a2a_client.send_message(message)
-            start_time = time.time()
-            last_task = None
-            while (time_left := _get_time_left_for_task_completion_waiting(start_time)) > 0:
-                try:
-                    response = await asyncio.wait_for(response_iterator.__anext__(), timeout=time_left)
-                except StopAsyncIteration:
-                    if last_task and last_task.status.state in (
-                        TaskState.completed,
-                        TaskState.failed,
-                        TaskState.rejected,
-                    ):
-                        # Update task history with completion
-                        final_status = (
-                            TaskStatus.COMPLETED if last_task.status.state == TaskState.completed else TaskStatus.FAILED
-                        )
-                        await task_history.update(internal_task_id, status=final_status, end_time=datetime.now())
-                        await _save_agent_logs_from_task(last_task, internal_task_id)
-                        await agent_registry.update_status(agent_id, AgentStatus.AVAILABLE)
-                        await agent_registry.set_current_task(agent_id, None)
-                        return last_task
-                    await task_history.update(
-                        internal_task_id, TaskStatus.FAILED, datetime.now(), "Iterator finished before completion"
-                    )
-                    # Release agent as AVAILABLE since this is a protocol issue, not agent issue
-                    await agent_registry.update_status(agent_id, AgentStatus.AVAILABLE)
-                    await agent_registry.set_current_task(agent_id, None)
-                    _handle_exception(
-                        f"Task '{task_description}' iterator finished before completion.",
-                        500,
-                        internal_task_id,
-                        agent_id,
-                    )
-                except TimeoutError:
-                    logger.error(
-                        f"Task '{task_description}' timed out while waiting for completion.",
-                        extra={"task_id": internal_task_id, "agent_id": agent_id},
-                    )
-                    await task_history.update(internal_task_id, TaskStatus.FAILED, datetime.now(), "Task timed out")
-                    stuck_task_id = last_task.id if last_task else None
-                    await agent_registry.update_status(
-                        agent_id, AgentStatus.BROKEN, BrokenReason.TASK_STUCK, stuck_task_id
-                    )
-                    await agent_registry.set_current_task(agent_id, None)
-                    await cancellation_queue.put((agent_id, time.time()))
-                    _handle_exception(
-                        f"Task '{task_description}' timed out while waiting for completion.",
-                        408,
-                        internal_task_id,
-                        agent_id,
-                    )
-
-                if isinstance(response, JSONRPCErrorResponse):
-                    await task_history.update(internal_task_id, TaskStatus.FAILED, datetime.now(), str(response.error))
-                    # Release agent as AVAILABLE since this is a task-level error
-                    await agent_registry.update_status(agent_id, AgentStatus.AVAILABLE)
-                    await agent_registry.set_current_task(agent_id, None)
-                    _handle_exception(
-                        f"Couldn't execute the task '{task_description}'. Root cause: {response.error}",
-                        500,
-                        internal_task_id,
-                        agent_id,
-                    )
+        a2a_client = _get_a2a_client(agent_id, agent_card)
 
-                if isinstance(response, tuple):
-                    task, _ = response
-                    last_task = task
-                    if task.status.state in (TaskState.completed, TaskState.failed, TaskState.rejected):
-                        logger.info(
-                            f"Task '{task_description}' was completed with status '{task.status.state!s}'.",
-                            extra={"task_id": internal_task_id, "agent_id": agent_id},
-                        )
-                        final_status = (
-                            TaskStatus.COMPLETED if task.status.state == TaskState.completed else TaskStatus.FAILED
+        response_iterator = a2a_client.send_message(message)
+        try:
+            # One deadline for the whole stream instead of re-arming a timer for every received message
+            async with asyncio.timeout(config.OrchestratorConfig.TASK_EXECUTION_TIMEOUT):
+                async for response in response_iterator:
+                    # Stream items are concrete a2a types, so exact type checks avoid isinstance's MRO walk per message
+                    response_type = type(response)
+                    if response_type is JSONRPCErrorResponse:
+                        await task_history.update(
+                            internal_task_id, TaskStatus.FAILED, datetime.now(), str(response.error)
                         )
-                        error_msg = (
-                            get_message_text(task.status.message) if task.status.state != TaskState.completed else None
+                        # Release agent as AVAILABLE since this is a task-level error
+                        await agent_registry.release_agent(agent_id, AgentStatus.AVAILABLE)
+                        _handle_exception(
+                            f"Couldn't execute the task '{task_description}'. Root cause: {response.error}",
+                            500,
+                            internal_task_id,
+                            agent_id,
                         )
-                        await task_history.update(internal_task_id, final_status, datetime.now(), error_msg)
-                        await _save_agent_logs_from_task(task, internal_task_id)
-                        await agent_registry.update_status(agent_id, AgentStatus.AVAILABLE)
-                        await agent_registry.set_current_task(agent_id, None)
-                        return task
-                    else:
-                        logger.debug(
-                            f"Task for {task_description} is still in '{task.status.state}' state. Waiting for its "
-                            f"completion. Agent: '{agent_card.name}' (ID: {agent_id})",
+
+                    if response_type is tuple:
+                        task, _ = response
+                        last_task = task
+                        if task.status.state in _FINAL_TASK_STATES:
+                            logger.info(
+                                f"Task '{task_description}' was completed with status '{task.status.state!s}'.",
+                                extra={"task_id": internal_task_id, "agent_id": agent_id},
+                            )
+                            final_status = (
+                                TaskStatus.COMPLETED if task.status.state == TaskState.completed else TaskStatus.FAILED
+                            )
+                            error_msg = (
+                                get_message_text(task.status.message)
+                                if task.status.state != TaskState.completed
+                                else None
+                            )
+                            await task_history.update(
+                                internal_task_id,
+                                final_status,
+                                datetime.now(),
+                                error_msg,
+                                _get_agent_logs_from_task(task, internal_task_id),
+                            )
+                            await agent_registry.release_agent(agent_id, AgentStatus.AVAILABLE)
+                            return task
+                        elif logger.isEnabledFor(logging.DEBUG):
+                            # Guarded: this fires for every intermediate update and the f-string is built eagerly
+                            logger.debug(
+                                f"Task for {task_description} is still in '{task.status.state}' state. Waiting for "
+                                f"its completion. Agent: '{agent_card.name}' (ID: {agent_id})",
+                                extra={"task_id": internal_task_id, "agent_id": agent_id},
+                            )
+                    elif response_type is Message and logger.isEnabledFor(logging.INFO):
+                        msg_text = get_message_text(response)
+                        logger.info(
+                            f"Received a message from agent in the scope of the task '{task_description}': {msg_text}",
                             extra={"task_id": internal_task_id, "agent_id": agent_id},
                         )
-                elif isinstance(response, Message):
-                    msg_text = get_message_text(response)
-                    logger.info(
-                        f"Received a message from agent in the scope of the task '{task_description}': {msg_text}",
-                        extra={"task_id": internal_task_id, "agent_id": agent_id},
-                    )
-
-            await task_history.update(
-                internal_task_id, TaskStatus.FAILED, datetime.now(), "Timeout waiting for completion"
+        except TimeoutError:
+            logger.error(
+                f"Task '{task_description}' timed out while waiting for completion.",
+                extra={"task_id": internal_task_id, "agent_id": agent_id},
             )
-            # Release agent as BROKEN since we hit overall timeout
-            await agent_registry.update_status(agent_id, AgentStatus.BROKEN, BrokenReason.TASK_STUCK)
-            await agent_registry.set_current_task(agent_id, None)
-            await cancellation_queue.put((agent_id, time.time()))
+            await task_history.update(internal_task_id, TaskStatus.FAILED, datetime.now(), "Task timed out")
+            stuck_task_id = last_task.id if last_task else None
+            await agent_registry.release_agent(agent_id, AgentStatus.BROKEN, BrokenReason.TASK_STUCK, stuck_task_id)
+            _enqueue_agent_recovery(agent_id)
             _handle_exception(
-                f"Task for {task_description} wasn't complete within timeout.", 408, internal_task_id, agent_id
+                f"Task '{task_description}' timed out while waiting for completion.",
+                408,
+                internal_task_id,
+                agent_id,
             )
-            return None
+
+        # The stream ended without delivering a task in a final state
+        if last_task and last_task.status.state in _FINAL_TASK_STATES:
+            final_status = TaskStatus.COMPLETED if last_task.status.state == TaskState.completed else TaskStatus.FAILED
+            await task_history.update(
+                internal_task_id,
+                status=final_status,
+                end_time=datetime.now(),
+                agent_logs=_get_agent_logs_from_task(last_task, internal_task_id),
+            )
+            await agent_registry.release_agent(agent_id, AgentStatus.AVAILABLE)
+            return last_task
+        await task_history.update(
+            internal_task_id, TaskStatus.FAILED, datetime.now(), "Iterator finished before completion"
+        )
+        # Release agent as AVAILABLE since this is a protocol issue, not agent issue
+        await agent_registry.release_agent(agent_id, AgentStatus.AVAILABLE)
+        _handle_exception(
+            f"Task '{task_description}' iterator finished before completion.",
+            500,
+            internal_task_id,
+            agent_id,
+        )
+        return None
 
     except HTTPException:
         # HTTPException is raised by _handle_exception, agent status already handled above
         raise
+    except asyncio.CancelledError:
+        # The caller went away (e.g. client disconnect); don't leave the reserved agent BUSY forever
+        if agent_id:
+            stuck_task_id = last_task.id if last_task else None
+            await asyncio.shield(_release_agent_after_cancellation(agent_id, internal_task_id, stuck_task_id))
+        raise
     except Exception as e:
         logger.exception(
             f"Error communicating with agent {agent_id}.", extra={"task_id": internal_task_id, "agent_id": agent_id}
@@ -1183,12 +1283,25 @@ async def _send_task_to_agent_with_message(message: Message, task_description: s
         with suppress(Exception):
             await task_history.update(internal_task_id, TaskStatus.FAILED, datetime.now(), str(e))
         # Connection/communication error likely means agent is offline
-        await agent_registry.update_status(agent_id, AgentStatus.BROKEN, BrokenReason.OFFLINE)
-        await agent_registry.set_current_task(agent_id, None)
-        await cancellation_queue.put((agent_id, time.time()))
+        await agent_registry.release_agent(agent_id, AgentStatus.BROKEN, BrokenReason.OFFLINE)
+        _enqueue_agent_recovery(agent_id)
         raise
 
 
+async def _release_agent_after_cancellation(agent_id: str, internal_task_id: str, stuck_task_id: str | None) -> None:
+    """Release an agent whose task was abandoned because the calling coroutine was cancelled.
+
+    If the agent already accepted the task, it may still be running it remotely, so the agent goes through the
+    regular TASK_STUCK recovery (which cancels the remote task) instead of being handed new work straight away.
+    """
+    await task_history.update(internal_task_id, TaskStatus.CANCELLED, datetime.now(), "Task cancelled by the caller")
+    if stuck_task_id:
+        await agent_registry.release_agent(agent_id, AgentStatus.BROKEN, BrokenReason.TASK_STUCK, stuck_task_id)
+        _enqueue_agent_recovery(agent_id)
+    else:
+        await agent_registry.release_agent(agent_id, AgentStatus.AVAILABLE)
+
+
 async def _send_task_to_agent(input_data: str, task_description: str) -> Task | None:
     """Send a text message to an agent.
 
@@ -1223,12 +1336,14 @@ async def reserve_agent_waiting_if_needed(
         _handle_exception("Orchestrator has currently no registered agents.", 404, task_id=task_id)
 
     max_wait_time = config.OrchestratorConfig.TASK_EXECUTION_TIMEOUT
-    start_time = time.time()
+    deadline = time.monotonic() + max_wait_time
 
-    while (time.time() - start_time) < max_wait_time:
+    while True:
         # Try to atomically select and reserve an agent
         async with agent_selection_lock:
             available_agent_ids = await agent_registry.get_available_agents()
+            # Agents which can't take this task, so that only other agents becoming available are worth a new attempt
+            unsuitable_agent_ids = set(available_agent_ids)
             if available_agent_ids:
                 agent_id = await _select_agent(task_description, available_agent_ids, task_id)
                 if agent_id:
@@ -1239,17 +1354,25 @@ async def reserve_agent_waiting_if_needed(
                         if agent_card:
                             # Atomically mark as BUSY before releasing the lock
                             await agent_registry.update_status(agent_id, AgentStatus.BUSY)
-                            agent_name = await agent_registry.get_name(agent_id)
                             logger.info(
-                                f"Reserved agent '{agent_name}' (ID: {agent_id}) for task '{task_description}'",
+                                f"Reserved agent '{agent_card.name}' (ID: {agent_id}) for task '{task_description}'",
                                 extra={"task_id": task_id, "agent_id": agent_id},
                             )
                             return agent_id, agent_card
+                    # The selected agent got busy in the meantime, so it's worth waiting for it as well
+                    unsuitable_agent_ids.discard(agent_id)
                 # If _select_agent returned None, it means no suitable agent is currently
                 # available. Continue waiting - the suitable agent might become available later.
 
-        # No agent was reserved - wait 1s and retry (outside the lock)
-        await asyncio.sleep(10)
+        # No agent was reserved - wait (outside the lock) until some other agent becomes available
+        time_left = deadline - time.monotonic()
+        if time_left <= 0:
+            break
+        try:
+            async with asyncio.timeout(time_left):
+                await agent_registry.wait_for_other_available_agent(unsuitable_agent_ids)
+        except TimeoutError:
+            break
 
     # Timeout reached
     _handle_exception(
@@ -1269,15 +1392,41 @@ async def _get_jira_issue_key_from_request(request):
     return user_story_id
 
 
+@contextmanager
+def _jira_event_processing(endpoint: str, issue_key: str) -> Iterator[bool]:
+    """Tracks the processing of a Jira webhook and yields True if the same event is already being processed.
+
+    Jira re-delivers webhooks which don't get a timely response, so without this check a long-running workflow
+    would be started again for every re-delivery.
+    """
+    event = (endpoint, issue_key)
+    if event in _jira_events_in_progress:
+        logger.info(f"Ignoring duplicate Jira event for issue {issue_key}, it is already being processed.")
+        yield True
+        return
+    _jira_events_in_progress.add(event)
+    try:
+        yield False
+    finally:
+        _jira_events_in_progress.discard(event)
+
+
 def _record_error(message: str, task_id: str | None = None, agent_id: str | None = None) -> None:
-    """Log an error and record it in error_history without raising. Call from within an except block.
+    """Log an error and record it in error_history without raising, with the traceback of the handled exception if any.
 
     Args:
         message: Error message.
         task_id: Optional task ID related to the error.
         agent_id: Optional agent ID related to the error.
     """
-    logger.exception(message)
+    traceback_snippet = None
+    if sys.exception() is not None:
+        logger.exception(message)
+        # Only the tail of the traceback is kept, so there's no need to format the outer frames
+        traceback_snippet = traceback.format_exc(limit=-5)[-500:]
+    else:
+        # Validation failures are also reported from here, without any exception being handled
+        logger.error(message)
     error_record = ErrorRecord(
         error_id=str(uuid4()),
         timestamp=datetime.now(),
@@ -1285,9 +1434,9 @@ def _record_error(message: str, task_id: str | None = None, agent_id: str | None
         task_id=task_id,
         agent_id=agent_id,
         module="orchestrator.main",
-        traceback_snippet=traceback.format_exc()[-500:],
+        traceback_snippet=traceback_snippet,
     )
-    asyncio.create_task(error_history.add(error_record))  # noqa: RUF006
+    error_history.add(error_record)
 
 
 def _handle_exception(
@@ -1305,10 +1454,6 @@ def _handle_exception(
     raise HTTPException(status_code=status_code, detail=message)
 
 
-def _is_task_still_running(task_state: TaskState) -> bool:
-    return task_state in (TaskState.submitted, TaskState.working)
-
-
 def _validate_task_status(task: Task, task_description: str):
     if not task:
         _handle_exception(f"Something went wrong while executing the task for {task_description}.")
@@ -1320,16 +1465,20 @@ def _validate_task_status(task: Task, task_description: str):
         )
 
 
-def _get_time_left_for_task_completion_waiting(start_time):
-    return config.OrchestratorConfig.TASK_EXECUTION_TIMEOUT - (time.time() - start_time)
-
-
 async def _select_all_suitable_agent_ids(task_description: str) -> list[str]:
     """Selects all suitable agents from the registry for a given task.
 
     Only considers agents that are currently AVAILABLE for new tasks.
     """
     available_agent_ids = await agent_registry.get_available_agents()
+    # The LLM's choice only depends on the task and the offered agents, so repeated runs reuse it
+    registry_version = agent_registry.version
+    cache_key = (registry_version, frozenset(available_agent_ids), task_description)
+    cached = _agent_selection_cache.get(cache_key)
+    if cached and time.monotonic() - cached[0] < config.OrchestratorConfig.AGENT_SELECTION_CACHE_TTL_SECONDS:
+        logger.info(f"Reusing agents {cached[1]} selected earlier for task '{task_description}'.")
+        return list(cached[1])
+
     agents_info = await _get_agents_info(available_agent_ids)
     user_prompt = f"""
 Target task description: "{task_description}".
@@ -1339,15 +1488,24 @@ The list of all registered with you agents:\n{agents_info}
 
     result = await _run_agent_with_retry(lambda: multi_discovery_agent.run(user_prompt))
     selected_agent_ids = result.output.ids or []
-    valid_agent_ids = []
-    for agent_id in selected_agent_ids:
-        # Verify agent exists AND is in our available agents list
-        if await agent_registry.contains(agent_id) and agent_id in available_agent_ids:
-            valid_agent_ids.append(agent_id)
+    names_by_id = await agent_registry.get_names(selected_agent_ids)
+    # Verify agent exists AND is in our available agents list
+    valid_agent_ids = [
+        agent_id for agent_id in selected_agent_ids if agent_id in names_by_id and agent_id in available_agent_ids
+    ]
 
     for agent_id in valid_agent_ids:
-        agent_name = await agent_registry.get_name(agent_id)
-        logger.info(f"Selected agent '{agent_name}' with ID '{agent_id}' for task '{task_description}'.")
+        logger.info(f"Selected agent '{names_by_id[agent_id]}' with ID '{agent_id}' for task '{task_description}'.")
+
+    # Entries for an older registry version can never match again, and expired ones would only be recomputed
+    now = time.monotonic()
+    ttl_seconds = config.OrchestratorConfig.AGENT_SELECTION_CACHE_TTL_SECONDS
+    for stale_key, (selected_at, _) in list(_agent_selection_cache.items()):
+        if stale_key[0] != registry_version or now - selected_at >= ttl_seconds:
+            del _agent_selection_cache[stale_key]
+    # An empty selection is likely a bad LLM answer, so the next run asks again instead of reusing it
+    if valid_agent_ids:
+        _agent_selection_cache[cache_key] = (now, list(valid_agent_ids))
     return valid_agent_ids
 
 
@@ -1360,16 +1518,21 @@ async def _get_agents_info(available_agent_ids: list[str]) -> str:
     Returns:
         Formatted string with agent information for the discovery agent.
     """
-    agents_info = ""
-    all_cards = await agent_registry.get_all_cards()
-    for agent_id in available_agent_ids:
-        card = all_cards.get(agent_id)
-        if card:
-            agents_info += (
+    global _agent_info_lines_cache
+    registry_version = agent_registry.version
+    if _agent_info_lines_cache is None or _agent_info_lines_cache[0] != registry_version:
+        # Cards only change on discovery, so the formatted lines are rebuilt just when the registry changes
+        all_cards = await agent_registry.get_all_cards()
+        info_lines = {
+            agent_id: (
                 f"- Name: {card.name}, ID: {agent_id}, Description: {card.description}, Skills: "
                 f"{'; '.join(skill.description for skill in card.skills)}\n"
             )
-    return agents_info
+            for agent_id, card in all_cards.items()
+        }
+        _agent_info_lines_cache = (registry_version, info_lines)
+    info_lines = _agent_info_lines_cache[1]
+    return "".join(info_lines[agent_id] for agent_id in available_agent_ids if agent_id in info_lines)
 
 
 async def _select_agent(
@@ -1417,34 +1580,51 @@ async def _fetch_agent_card(agent_base_url: str) -> AgentCard | None:
     agent_card_url = f"{agent_base_url}/.well-known/agent-card.json"
     try:
         logger.info(f"Attempting to retrieve agent card from {agent_card_url}")
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                agent_card_url, timeout=config.OrchestratorConfig.AGENT_DISCOVERY_TIMEOUT_SECONDS
-            )
-            response.raise_for_status()
-            agent_card = AgentCard(**response.json())
-            actual_agent_name = agent_card.name
-            logger.info(f"Successfully retrieved and registered the agent card for '{actual_agent_name}'.")
-            return agent_card
+        response = await orchestrator_http_client.get(
+            agent_card_url, timeout=config.OrchestratorConfig.AGENT_DISCOVERY_TIMEOUT_SECONDS
+        )
+        response.raise_for_status()
+        agent_card = AgentCard.model_validate_json(response.content)
+        actual_agent_name = agent_card.name
+        logger.info(f"Successfully retrieved and registered the agent card for '{actual_agent_name}'.")
+        return agent_card
     except Exception as exc:
         logger.warning(f"Could not retrieve agent card from {agent_card_url}. Error: {exc}")
         return None
 
 
+async def _is_port_open(agent_base_url: str) -> bool:
+    """Cheap TCP connect probe, so closed ports are rejected without waiting for the HTTP timeout."""
+    url_parts = urlsplit(agent_base_url)
+    if not url_parts.hostname:
+        return False
+    port = url_parts.port or (443 if url_parts.scheme == "https" else 80)
+    try:
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(url_parts.hostname, port),
+            timeout=config.OrchestratorConfig.AGENT_DISCOVERY_PORT_PROBE_TIMEOUT_SECONDS,
+        )
+    except (OSError, TimeoutError):
+        return False
+    writer.close()
+    with suppress(OSError):
+        await writer.wait_closed()
+    return True
+
+
 async def _check_agent_reachability(agent_base_url: str) -> bool:
     agent_card_url = f"{agent_base_url}/.well-known/agent-card.json"
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                agent_card_url, timeout=config.OrchestratorConfig.AGENT_DISCOVERY_TIMEOUT_SECONDS
-            )
-            return response.status_code == 200
+        response = await orchestrator_http_client.get(
+            agent_card_url, timeout=config.OrchestratorConfig.AGENT_DISCOVERY_TIMEOUT_SECONDS
+        )
+        return response.status_code == 200
     except Exception:
         return False
 
 
-async def _process_url_discovery(url: str):
-    existing_agent_id = await agent_registry.get_agent_id_by_url(url)
+async def _process_url_discovery(url: str, known_agent_ids_by_url: dict[str, str]):
+    existing_agent_id = known_agent_ids_by_url.get(url)
     if existing_agent_id:
         if await _check_agent_reachability(url):
             status = await agent_registry.get_status(existing_agent_id)
@@ -1459,32 +1639,33 @@ async def _process_url_discovery(url: str):
         else:
             logger.info(f"Agent {existing_agent_id} at {url} is unreachable. Removing from registry.")
             await agent_registry.remove(existing_agent_id)
-    else:
+            _a2a_clients_by_agent.pop(existing_agent_id, None)
+    elif await _is_port_open(url):
         agent_card = await _fetch_agent_card(url)
         if agent_card:
-            existing_agent_id = await agent_registry.get_agent_id_by_url(agent_card.url)
+            existing_agent_id = known_agent_ids_by_url.get(agent_card.url)
             if existing_agent_id:
                 logger.debug(f"Agent with URL {agent_card.url} is already registered with ID {existing_agent_id}.")
             else:
                 new_agent_id = str(uuid4())
+                # Claim the URL before awaiting so concurrent probes resolving to the same card don't double-register
+                known_agent_ids_by_url[agent_card.url] = new_agent_id
                 await agent_registry.register(new_agent_id, agent_card)
                 logger.info(f"Discovered and registered agent with URL: {agent_card.url}")
 
 
-async def _discover_agents():
-    """
-    Discovers remote agents by scanning a port range on each of the configured base URLs.
-    Checks reachability of existing agents and discovers new ones.
-    """
-    agent_base_urls_str = config.OrchestratorConfig.REMOTE_EXECUTION_AGENT_HOSTS
-    port_range_str = config.OrchestratorConfig.AGENT_DISCOVERY_PORTS
+@lru_cache(maxsize=8)
+def _build_discovery_urls(agent_base_urls_str: str, port_range_str: str) -> frozenset[str]:
+    """Expand the configured hosts and port range into agent base URLs.
 
+    Cached on the raw config strings, which are static, so periodic discovery doesn't re-parse them every cycle.
+    """
     if not agent_base_urls_str or not port_range_str:
         logger.info(
             "Agent discovery configuration is incomplete. "
             "Please set both REMOTE_EXECUTION_AGENT_HOSTS and AGENT_DISCOVERY_PORTS."
         )
-        return
+        return frozenset()
 
     base_urls = [url.strip() for url in agent_base_urls_str.split(",")]
 
@@ -1495,19 +1676,38 @@ async def _discover_agents():
             f"Invalid port range format for AGENT_DISCOVERY_PORTS: '{port_range_str}'. "
             f"Expected format is 'start-end', e.g., '8001-8010'."
         )
-        return
-
-    remote_agent_urls = []
-    for base_url in base_urls:
-        for port in range(start_port, end_port + 1):
-            remote_agent_urls.append(f"{base_url}:{port}")
+        return frozenset()
 
+    remote_agent_urls = frozenset(
+        f"{base_url}:{port}" for base_url in base_urls for port in range(start_port, end_port + 1)
+    )
     if not remote_agent_urls:
         logger.warning("No agent URLs were generated for discovery.")
+    return remote_agent_urls
+
+
+async def _discover_agents():
+    """
+    Discovers remote agents by scanning a port range on each of the configured base URLs.
+    Checks reachability of existing agents and discovers new ones.
+    """
+    remote_agent_urls = _build_discovery_urls(
+        config.OrchestratorConfig.REMOTE_EXECUTION_AGENT_HOSTS, config.OrchestratorConfig.AGENT_DISCOVERY_PORTS
+    )
+    if not remote_agent_urls:
         return
 
-    tasks = [_process_url_discovery(url) for url in set(remote_agent_urls)]
-    await asyncio.gather(*tasks)
+    # Snapshot registered URLs once, so each probe is a dict lookup rather than a locked scan of the registry
+    known_agent_ids_by_url = await agent_registry.get_agent_ids_by_url()
+
+    # Bound the fan-out so wide port ranges don't open hundreds of sockets at once
+    semaphore = asyncio.Semaphore(config.OrchestratorConfig.AGENT_DISCOVERY_CONCURRENCY)
+
+    async def _process_url_discovery_bounded(url: str):
+        async with semaphore:
+            await _process_url_discovery(url, known_agent_ids_by_url)
+
+    await asyncio.gather(*(_process_url_discovery_bounded(url) for url in remote_agent_urls))
 
 
 # =============================================================================
@@ -1520,6 +1720,10 @@ STATIC_FILES_DIR = Path(__file__).parent / "static"
 if STATIC_FILES_DIR.exists():
     # Mount static files (JS, CSS, assets)
     orchestrator_app.mount("/assets", StaticFiles(directory=STATIC_FILES_DIR / "assets"), name="assets")
+    # The built UI doesn't change at runtime, so the SPA fallback can look files up without touching the filesystem
+    _static_file_paths = frozenset(
+        path.relative_to(STATIC_FILES_DIR).as_posix() for path in STATIC_FILES_DIR.rglob("*") if path.is_file()
+    )
 
     # Serve index.html for the root path
     @orchestrator_app.get("/")
@@ -1539,9 +1743,8 @@ if STATIC_FILES_DIR.exists():
         if full_path.startswith("api/"):
             raise HTTPException(status_code=404, detail="API endpoint not found")
         # Check if file exists in static dir
-        file_path = STATIC_FILES_DIR / full_path
-        if file_path.exists() and file_path.is_file():
-            return FileResponse(file_path)
+        if full_path in _static_file_paths:
+            return FileResponse(STATIC_FILES_DIR / full_path)
         # Return index.html for client-side routing
         return FileResponse(STATIC_FILES_DIR / "index.html")
 else:
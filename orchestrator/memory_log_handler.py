@@ -13,7 +13,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class LogEntry:
     """Represents a single log entry."""
 
@@ -35,6 +35,22 @@ class LogEntry:
         }
 
 
+@dataclass(slots=True, frozen=True)
+class _BufferedRecord:
+    """The parts of a log record needed to build a LogEntry, which is formatted only when it's read."""
+
+    name: str
+    levelno: int
+    levelname: str
+    message: str
+    created: float
+    msecs: float
+    exc_text: str | None
+    stack_info: str | None
+    task_id: str | None
+    agent_id: str | None
+
+
 class MemoryLogHandler(logging.Handler):
     """
     A logging handler that stores log records in a ring buffer.
@@ -56,7 +72,7 @@ class MemoryLogHandler(logging.Handler):
         if self._initialized:
             return
         super().__init__()
-        self._buffer: deque[LogEntry] = deque(maxlen=max_size)
+        self._buffer: deque[_BufferedRecord] = deque(maxlen=max_size)
         self._buffer_lock = threading.Lock()
         self._initialized = True
         self.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
@@ -64,19 +80,51 @@ class MemoryLogHandler(logging.Handler):
     def emit(self, record: logging.LogRecord) -> None:
         """Store the log record in the buffer."""
         try:
-            entry = LogEntry(
-                timestamp=datetime.fromtimestamp(record.created).isoformat(),
-                level=record.levelname,
-                logger_name=record.name,
-                message=self.format(record),
-                task_id=getattr(record, "task_id", None),
-                agent_id=getattr(record, "agent_id", None),
+            # Only resolve what the record must not keep referencing (args and traceback), most entries are never read
+            exc_text = record.exc_text
+            if record.exc_info and not exc_text:
+                exc_text = self.formatter.formatException(record.exc_info)
+            # task_id/agent_id only exist when passed via `extra`, a dict lookup avoids getattr's failed attribute search
+            record_attributes = record.__dict__
+            buffered_record = _BufferedRecord(
+                name=record.name,
+                levelno=record.levelno,
+                levelname=record.levelname,
+                message=record.getMessage(),
+                created=record.created,
+                msecs=record.msecs,
+                exc_text=exc_text,
+                stack_info=record.stack_info,
+                task_id=record_attributes.get("task_id"),
+                agent_id=record_attributes.get("agent_id"),
             )
             with self._buffer_lock:
-                self._buffer.append(entry)
+                self._buffer.append(buffered_record)
         except Exception:
             self.handleError(record)
 
+    def _to_log_entry(self, buffered_record: _BufferedRecord) -> LogEntry:
+        record = logging.makeLogRecord(
+            {
+                "name": buffered_record.name,
+                "levelno": buffered_record.levelno,
+                "levelname": buffered_record.levelname,
+                "msg": buffered_record.message,
+                "created": buffered_record.created,
+                "msecs": buffered_record.msecs,
+                "exc_text": buffered_record.exc_text,
+                "stack_info": buffered_record.stack_info,
+            }
+        )
+        return LogEntry(
+            timestamp=datetime.fromtimestamp(buffered_record.created).isoformat(),
+            level=buffered_record.levelname,
+            logger_name=buffered_record.name,
+            message=self.format(record),
+            task_id=buffered_record.task_id,
+            agent_id=buffered_record.agent_id,
+        )
+
     def get_logs(
         self,
         limit: int = 100,
@@ -97,37 +145,29 @@ class MemoryLogHandler(logging.Handler):
         Returns:
             List of LogEntry objects, newest first.
         """
-        with self._buffer_lock:
-            logs = list(self._buffer)
-
-        # Filter by level if specified
-        if level:
-            level_upper = level.upper()
-            logs = [log for log in logs if log.level == level_upper]
-
-        if task_id:
-            logs = [log for log in logs if log.task_id == task_id]
-
-        if agent_id:
-            logs = [log for log in logs if log.agent_id == agent_id]
-
-        if not logs:
+        if limit <= 0:
             return []
 
-        # Return newest first, limited with offset
-        # logs is [oldest, ..., newest]
-        # with offset=0, limit=100 -> we want logs[-100:] reversed
-        # with offset=100, limit=100 -> we want logs[-200:-100] reversed
-
-        total_logs = len(logs)
-        if offset >= total_logs:
-            return []
-
-        end = total_logs - offset
-        start = max(0, end - limit)
-
-        sliced_logs = logs[start:end]
-        return list(reversed(sliced_logs))
+        level_upper = level.upper() if level else None
+        matched_logs: list[_BufferedRecord] = []
+        skipped = 0
+        # Scan from the newest entry and stop once the requested page is filled, instead of copying
+        # and filtering the whole buffer on every dashboard poll
+        with self._buffer_lock:
+            for log in reversed(self._buffer):
+                if level_upper and log.levelname != level_upper:
+                    continue
+                if task_id and log.task_id != task_id:
+                    continue
+                if agent_id and log.agent_id != agent_id:
+                    continue
+                if skipped < offset:
+                    skipped += 1
+                    continue
+                matched_logs.append(log)
+                if len(matched_logs) == limit:
+                    break
+        return [self._to_log_entry(log) for log in matched_logs]
 
     def clear(self) -> None:
         """Clear all buffered logs."""
@@ -11,9 +11,11 @@ logic and the dashboard service, avoiding circular imports.
 
 import asyncio
 from collections import deque
+from collections.abc import Collection, Iterable
 from dataclasses import dataclass
 from datetime import datetime
 from enum import StrEnum
+from itertools import islice
 from typing import Any
 
 from a2a.types import AgentCard
@@ -44,7 +46,7 @@ class TaskStatus(StrEnum):
     CANCELLED = "CANCELLED"
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskRecord:
     """Record of a task for history tracking."""
 
@@ -81,7 +83,7 @@ class TaskRecord:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorRecord:
     """Record of an error for history tracking."""
 
@@ -106,72 +108,84 @@ class ErrorRecord:
         }
 
 
+@dataclass(slots=True, frozen=True)
+class CancellationRequest:
+    """Request to recover a broken agent, queued for the background recovery task."""
+
+    agent_id: str
+    broken_since: float  # time.monotonic() when the agent was first marked BROKEN
+    attempt: int = 0  # Number of failed recovery attempts so far
+
+
 class TaskHistory:
-    """Thread-safe ring buffer for task history."""
+    """Ring buffer for task history.
+
+    All access happens on the orchestrator's event loop and no method awaits, so no lock is needed; the methods stay
+    async for API compatibility.
+    """
 
     def __init__(self, max_size: int = 100):
         self._tasks: deque[TaskRecord] = deque(maxlen=max_size)
-        self._lock = asyncio.Lock()
         self._tasks_by_id: dict[str, TaskRecord] = {}
 
     async def add(self, task: TaskRecord) -> None:
-        """Add a new task record."""
-        async with self._lock:
-            self._tasks.append(task)
-            self._tasks_by_id[task.task_id] = task
+        """Add a new task record, evicting the oldest one from the ID index once the buffer is full."""
+        if len(self._tasks) == self._tasks.maxlen:
+            self._tasks_by_id.pop(self._tasks[0].task_id, None)
+        self._tasks.append(task)
+        self._tasks_by_id[task.task_id] = task
 
     async def update(
-        self, task_id: str, status: TaskStatus, end_time: datetime | None = None, error_message: str | None = None
+        self,
+        task_id: str,
+        status: TaskStatus,
+        end_time: datetime | None = None,
+        error_message: str | None = None,
+        agent_logs: list[str] | None = None,
     ) -> None:
         """Update an existing task record."""
-        async with self._lock:
-            if task_id in self._tasks_by_id:
-                task = self._tasks_by_id[task_id]
-                task.status = status
-                if end_time:
-                    task.end_time = end_time
-                if error_message:
-                    task.error_message = error_message
+        if task := self._tasks_by_id.get(task_id):
+            task.status = status
+            if end_time:
+                task.end_time = end_time
+            if error_message:
+                task.error_message = error_message
+            if agent_logs:
+                task.agent_logs = agent_logs
 
     async def get_all(self) -> list[TaskRecord]:
         """Get all task records, newest first."""
-        async with self._lock:
-            return list(reversed(self._tasks))
+        return list(reversed(self._tasks))
 
-    async def update_logs(self, task_id: str, logs: list[str]) -> None:
-        """Update task with agent logs."""
-        async with self._lock:
-            if task_id in self._tasks_by_id:
-                task = self._tasks_by_id[task_id]
-                task.agent_logs = logs
+    async def get_recent(self, limit: int = 50) -> list[TaskRecord]:
+        """Get the most recent N task records, newest first."""
+        return list(islice(reversed(self._tasks), limit))
 
     async def get_by_id(self, task_id: str) -> TaskRecord | None:
         """Get a specific task by ID."""
-        async with self._lock:
-            return self._tasks_by_id.get(task_id)
+        return self._tasks_by_id.get(task_id)
 
 
 class ErrorHistory:
-    """Thread-safe ring buffer for error history."""
+    """Ring buffer for error history; like TaskHistory, it is only accessed from the event loop and needs no lock."""
 
     def __init__(self, max_size: int = 50):
         self._errors: deque[ErrorRecord] = deque(maxlen=max_size)
-        self._lock = asyncio.Lock()
 
-    async def add(self, error: ErrorRecord) -> None:
-        """Add a new error record."""
-        async with self._lock:
-            self._errors.append(error)
+    def add(self, error: ErrorRecord) -> None:
+        """Add a new error record.
+
+        Synchronous so that errors can be recorded from any context without scheduling a task.
+        """
+        self._errors.append(error)
 
     async def get_all(self) -> list[ErrorRecord]:
         """Get all error records, newest first."""
-        async with self._lock:
-            return list(reversed(self._errors))
+        return list(reversed(self._errors))
 
     async def get_recent(self, limit: int = 10) -> list[ErrorRecord]:
         """Get the most recent N errors."""
-        async with self._lock:
-            return list(reversed(list(self._errors)[-limit:]))
+        return list(islice(reversed(self._errors), limit))
 
 
 class AgentRegistry:
@@ -183,7 +197,16 @@ class AgentRegistry:
         self._broken_reasons: dict[str, BrokenReason] = {}
         self._stuck_task_ids: dict[str, str] = {}  # agent_id -> last stuck task_id
         self._current_tasks: dict[str, str] = {}  # agent_id -> current task_id
+        self._ids_by_url: dict[str, str] = {}  # card URL -> agent_id
+        self._version = 0  # Bumped whenever the set of registered cards changes
         self._lock = asyncio.Lock()
+        # Shares the registry lock, so status waiters see every change made under it
+        self._status_changed = asyncio.Condition(self._lock)
+
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever an agent card is registered or removed."""
+        return self._version
 
     async def get_card(self, agent_id: str) -> AgentCard | None:
         async with self._lock:
@@ -194,11 +217,22 @@ class AgentRegistry:
             card = self._cards.get(agent_id)
             return card.name if card else "Unknown"
 
-    async def register(self, agent_id: str, card: AgentCard):
+    async def get_names(self, agent_ids: Iterable[str]) -> dict[str, str]:
+        """Get the names of the given agents under a single lock; unregistered IDs are omitted."""
         async with self._lock:
+            return {agent_id: card.name for agent_id in agent_ids if (card := self._cards.get(agent_id))}
+
+    async def register(self, agent_id: str, card: AgentCard):
+        async with self._status_changed:
+            previous_card = self._cards.get(agent_id)
+            if previous_card and self._ids_by_url.get(previous_card.url) == agent_id:
+                del self._ids_by_url[previous_card.url]
             self._cards[agent_id] = card
+            self._ids_by_url[card.url] = agent_id
+            self._version += 1
             if agent_id not in self._statuses:
                 self._statuses[agent_id] = AgentStatus.AVAILABLE
+                self._status_changed.notify_all()
 
     async def update_status(
         self,
@@ -207,18 +241,37 @@ class AgentRegistry:
         broken_reason: BrokenReason | None = None,
         stuck_task_id: str | None = None,
     ):
-        async with self._lock:
-            if agent_id in self._cards:
-                self._statuses[agent_id] = status
-                if status == AgentStatus.BROKEN and broken_reason:
-                    self._broken_reasons[agent_id] = broken_reason
-                    if stuck_task_id:
-                        self._stuck_task_ids[agent_id] = stuck_task_id
-                elif status == AgentStatus.AVAILABLE:
-                    # Clear broken context when agent becomes available
-                    self._broken_reasons.pop(agent_id, None)
-                    self._stuck_task_ids.pop(agent_id, None)
-                    self._current_tasks.pop(agent_id, None)
+        async with self._status_changed:
+            self._set_status(agent_id, status, broken_reason, stuck_task_id)
+
+    async def release_agent(
+        self,
+        agent_id: str,
+        status: AgentStatus,
+        broken_reason: BrokenReason | None = None,
+        stuck_task_id: str | None = None,
+    ):
+        """Clear the current task of an agent and update its status in a single locked step."""
+        async with self._status_changed:
+            self._current_tasks.pop(agent_id, None)
+            self._set_status(agent_id, status, broken_reason, stuck_task_id)
+
+    def _set_status(
+        self, agent_id: str, status: AgentStatus, broken_reason: BrokenReason | None, stuck_task_id: str | None
+    ):
+        # Must be called while holding the registry lock
+        if agent_id in self._cards:
+            self._statuses[agent_id] = status
+            self._status_changed.notify_all()
+            if status == AgentStatus.BROKEN and broken_reason:
+                self._broken_reasons[agent_id] = broken_reason
+                if stuck_task_id:
+                    self._stuck_task_ids[agent_id] = stuck_task_id
+            elif status == AgentStatus.AVAILABLE:
+                # Clear broken context when agent becomes available
+                self._broken_reasons.pop(agent_id, None)
+                self._stuck_task_ids.pop(agent_id, None)
+                self._current_tasks.pop(agent_id, None)
 
     async def set_current_task(self, agent_id: str, task_id: str | None):
         """Set the current task for an agent."""
@@ -237,6 +290,27 @@ class AgentRegistry:
         async with self._lock:
             return self._statuses.get(agent_id, AgentStatus.BROKEN)
 
+    async def wait_for_status(self, agent_id: str, statuses: Collection[AgentStatus]) -> AgentStatus:
+        """Wait until the agent is in one of the given statuses and return it; unknown agents count as BROKEN."""
+        async with self._status_changed:
+            await self._status_changed.wait_for(lambda: self._statuses.get(agent_id, AgentStatus.BROKEN) in statuses)
+            return self._statuses.get(agent_id, AgentStatus.BROKEN)
+
+    async def wait_for_other_available_agent(self, excluded_agent_ids: Collection[str]) -> None:
+        """Wait until a registered agent which is not in excluded_agent_ids is AVAILABLE."""
+        async with self._status_changed:
+            await self._status_changed.wait_for(
+                lambda: any(
+                    status == AgentStatus.AVAILABLE and aid in self._cards and aid not in excluded_agent_ids
+                    for aid, status in self._statuses.items()
+                )
+            )
+
+    async def get_statuses(self, agent_ids: Iterable[str]) -> dict[str, AgentStatus]:
+        """Get the statuses of the given agents under a single lock; unknown IDs are reported as BROKEN."""
+        async with self._lock:
+            return {agent_id: self._statuses.get(agent_id, AgentStatus.BROKEN) for agent_id in agent_ids}
+
     async def get_broken_context(self, agent_id: str) -> tuple[BrokenReason | None, str | None]:
         """Get the reason and stuck task ID for a broken agent."""
         async with self._lock:
@@ -245,9 +319,14 @@ class AgentRegistry:
             return reason, task_id
 
     async def remove(self, agent_id: str):
-        async with self._lock:
-            self._cards.pop(agent_id, None)
-            self._statuses.pop(agent_id, None)
+        async with self._status_changed:
+            card = self._cards.pop(agent_id, None)
+            if card is not None:
+                if self._ids_by_url.get(card.url) == agent_id:
+                    del self._ids_by_url[card.url]
+                self._version += 1
+            if self._statuses.pop(agent_id, None) is not None:
+                self._status_changed.notify_all()
             self._broken_reasons.pop(agent_id, None)
             self._stuck_task_ids.pop(agent_id, None)
             self._current_tasks.pop(agent_id, None)
@@ -279,10 +358,12 @@ class AgentRegistry:
 
     async def get_agent_id_by_url(self, url: str) -> str | None:
         async with self._lock:
-            for agent_id, card in self._cards.items():
-                if card.url == url:
-                    return agent_id
-            return None
+            return self._ids_by_url.get(url)
+
+    async def get_agent_ids_by_url(self) -> dict[str, str]:
+        """Get a snapshot of the card URL -> agent ID index."""
+        async with self._lock:
+            return self._ids_by_url.copy()
 
     async def get_broken_agents(self) -> dict[str, tuple[BrokenReason | None, str | None]]:
         async with self._lock:
@@ -0,0 +1,23 @@
+# SPDX-FileCopyrightText: 2025 Taras Paruta (partarstu@gmail.com)
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Helpers shared by the model download scripts.
+"""
+
+import os
+
+WEIGHTS_FILE_NAMES = (
+    "model.safetensors",
+    "model.safetensors.index.json",
+    "pytorch_model.bin",
+    "pytorch_model.bin.index.json",
+)
+
+
+def is_model_saved(model_path: str) -> bool:
+    """Checks for a complete save: config.json is written before the weights, so both must be present."""
+    return os.path.exists(os.path.join(model_path, "config.json")) and any(
+        os.path.exists(os.path.join(model_path, file_name)) for file_name in WEIGHTS_FILE_NAMES
+    )
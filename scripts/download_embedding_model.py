@@ -20,10 +20,16 @@ from config import QdrantConfig  # noqa: I001
 
 from sentence_transformers import SentenceTransformer
 
+from scripts._download_common import is_model_saved
+
 if __name__ == "__main__":
     model_name = QdrantConfig.EMBEDDING_MODEL
     model_path = QdrantConfig.EMBEDDING_MODEL_PATH
 
+    if is_model_saved(model_path):
+        print(f"Embedding model already present in '{model_path}', skipping download.")
+        sys.exit(0)
+
     if not os.path.exists(model_path):
         os.makedirs(model_path)
 
@@ -24,9 +24,13 @@ from config import (  # noqa: I001
 
 from transformers import AutoModelForSequenceClassification, AutoTokenizer
 
+from scripts._download_common import is_model_saved
+
 if __name__ == "__main__":
     if not PROMPT_INJECTION_CHECK_ENABLED:
         print("Prompt injection detection is disabled, skipping detection model download.")
+    elif is_model_saved(PROMPT_INJECTION_DETECTION_MODEL_PATH):
+        print(f"Detection model already present in {PROMPT_INJECTION_DETECTION_MODEL_PATH}, skipping download.")
     else:
         if not os.path.exists(PROMPT_INJECTION_DETECTION_MODEL_PATH):
             os.makedirs(PROMPT_INJECTION_DETECTION_MODEL_PATH)
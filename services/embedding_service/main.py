@@ -1,5 +1,9 @@
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 
+import numpy as np
 import torch
 import uvicorn
 from fastapi import FastAPI, HTTPException
@@ -8,26 +12,51 @@ from sentence_transformers import SentenceTransformer
 
 import config
 from common import utils
+from common.micro_batching import process_in_micro_batches, submit_to_batch
 
 os.environ["TOKENIZERS_PARALLELISM"] = "true"
 
 logger = utils.get_logger("embedding_service")
 
-app = FastAPI(title="Embedding Service")
-
-# Model configuration - model is loaded lazily to avoid memory issues during worker forking
+# Model configuration - model is loaded by each worker on startup to avoid memory issues during worker forking
 _model_name = getattr(config.QdrantConfig, "EMBEDDING_MODEL", "jinaai/jina-embeddings-v3")
 _model_path = getattr(config.QdrantConfig, "EMBEDDING_MODEL_PATH", None)
+_quantization = getattr(config.QdrantConfig, "EMBEDDING_QUANTIZATION", "none")
 _embedding_model: SentenceTransformer | None = None
 
+# Single-text requests are coalesced into one model.encode call per batch
+_max_batch_size = getattr(config.QdrantConfig, "EMBEDDING_BATCH_MAX_SIZE", 64)
+_max_batch_wait_seconds = getattr(config.QdrantConfig, "EMBEDDING_BATCH_MAX_WAIT_SECONDS", 0.005)
+_pending_texts: asyncio.Queue[tuple[str, asyncio.Future[np.ndarray]]] | None = None
+# Every model call runs on this single thread: concurrent forward passes would only compete for the same CPU threads
+_encode_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="embedding-encode")
+
+
+def _apply_quantization(model: SentenceTransformer) -> None:
+    """Reduces the model precision in place according to the EMBEDDING_QUANTIZATION setting."""
+    if _quantization == "fp16":
+        if torch.cuda.is_available():
+            logger.info("Converting embedding model to FP16")
+            model.half()
+        else:
+            logger.warning("FP16 quantization requires a GPU, keeping the embedding model in full precision")
+    elif _quantization == "int8":
+        if model.device.type == "cpu":
+            logger.info("Applying dynamic int8 quantization to the embedding model")
+            torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+        else:
+            logger.warning("Dynamic int8 quantization is CPU-only, keeping the embedding model in full precision")
+    elif _quantization != "none":
+        logger.warning(f"Unknown EMBEDDING_QUANTIZATION value '{_quantization}', keeping full precision")
+
 
 def _get_embedding_model() -> SentenceTransformer:
     """
-    Lazily load the embedding model on first use.
+    Load the embedding model on first use.
 
     This prevents the model from being loaded during module import,
     which would cause memory issues with Gunicorn's pre-fork worker model.
-    The model is only loaded once per worker process.
+    The model is only loaded once per worker process, on the encode thread during startup.
     """
     global _embedding_model
     if _embedding_model is None:
@@ -40,10 +69,45 @@ def _get_embedding_model() -> SentenceTransformer:
         else:
             logger.info(f"Model not found locally at {_model_path}, downloading: {_model_name}")
             _embedding_model = SentenceTransformer(_model_name)
+        _apply_quantization(_embedding_model)
         logger.info("Embedding model loaded successfully")
     return _embedding_model
 
 
+def _encode(texts: list[str]) -> np.ndarray:
+    return _get_embedding_model().encode(
+        texts, batch_size=_max_batch_size, convert_to_numpy=True, show_progress_bar=False
+    )
+
+
+async def _run_on_encode_thread(texts: list[str]) -> np.ndarray:
+    return await asyncio.get_running_loop().run_in_executor(_encode_executor, _encode, texts)
+
+
+# noinspection PyUnusedLocal
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global _pending_texts
+    # Load (and quantize) the model on the encode thread without awaiting it, so the service starts answering /health
+    # right away; encode calls queue behind the load on the same thread. A failed load is retried by the next encode.
+    _encode_executor.submit(_get_embedding_model)
+    _pending_texts = asyncio.Queue()
+    batching_task = asyncio.create_task(
+        process_in_micro_batches(_pending_texts, _run_on_encode_thread, _max_batch_size, _max_batch_wait_seconds)
+    )
+
+    yield
+
+    if not batching_task.cancel():
+        try:
+            await batching_task
+        except asyncio.CancelledError:
+            logger.info("Embedding batching task successfully cancelled.")
+
+
+app = FastAPI(title="Embedding Service", lifespan=lifespan)
+
+
 class EmbeddingRequest(BaseModel):
     text: str
 
@@ -52,6 +116,14 @@ class EmbeddingResponse(BaseModel):
     embedding: list[float]
 
 
+class BatchEmbeddingRequest(BaseModel):
+    texts: list[str]
+
+
+class BatchEmbeddingResponse(BaseModel):
+    embeddings: list[list[float]]
+
+
 @app.get("/health")
 def health_check():
     return {"status": "ok"}
@@ -60,14 +132,23 @@ def health_check():
 @app.post("/embed", response_model=EmbeddingResponse)
 async def get_embedding(request: EmbeddingRequest):
     try:
-        model = _get_embedding_model()
-        embedding = model.encode(request.text)
+        embedding = await submit_to_batch(_pending_texts, request.text)
         return EmbeddingResponse(embedding=embedding.tolist())
     except Exception as e:
         logger.exception("Error generating embedding.")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/embed_batch", response_model=BatchEmbeddingResponse)
+async def get_embeddings_batch(request: BatchEmbeddingRequest):
+    try:
+        embeddings = await _run_on_encode_thread(request.texts)
+        return BatchEmbeddingResponse(embeddings=embeddings.tolist())
+    except Exception as e:
+        logger.exception("Error generating batch embeddings.")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8080))
     uvicorn.run(app, host="0.0.0.0", port=port)
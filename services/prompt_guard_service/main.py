@@ -1,5 +1,7 @@
+import asyncio
 import os
 import threading
+from contextlib import asynccontextmanager
 
 import torch
 import uvicorn
@@ -9,15 +11,19 @@ from transformers import AutoModelForSequenceClassification, AutoTokenizer, pipe
 
 import config
 from common import utils
+from common.micro_batching import process_in_micro_batches, submit_to_batch
 
 logger = utils.get_logger("prompt_guard_service")
 
-app = FastAPI(title="Prompt Guard Service")
-
 SLIDING_WINDOW_SIZE = 128
 MAX_TOKEN_LENGTH = 512
 MODEL_PATH = config.PROMPT_INJECTION_DETECTION_MODEL_PATH
 
+# Concurrent checks are coalesced into one classifier call per batch
+_max_batch_size = config.PROMPT_GUARD_BATCH_MAX_SIZE
+_max_batch_wait_seconds = config.PROMPT_GUARD_BATCH_MAX_WAIT_SECONDS
+_pending_checks: asyncio.Queue[tuple[list[str], asyncio.Future[list[dict]]]] | None = None
+
 
 class PromptGuardRequest(BaseModel):
     prompt: str
@@ -44,27 +50,40 @@ class ProtectAiPromptGuard:
     def __init__(self):
         logger.info(f"Initializing Prompt Guard model from {MODEL_PATH}")
         try:
-            self.tokenizer = AutoTokenizer.from_pretrained(MODEL_PATH)
+            self.tokenizer = AutoTokenizer.from_pretrained(MODEL_PATH, use_fast=True)
+            use_cuda = torch.cuda.is_available()
             self.classifier = pipeline(
                 "text-classification",
-                model=AutoModelForSequenceClassification.from_pretrained(MODEL_PATH),
+                # Half precision only on GPU, where tensor cores make it faster; CPU kernels stay in FP32
+                model=AutoModelForSequenceClassification.from_pretrained(
+                    MODEL_PATH, dtype=torch.float16 if use_cuda else torch.float32
+                ),
                 tokenizer=self.tokenizer,
-                device=torch.device("cuda" if torch.cuda.is_available() else "cpu"),
+                device=torch.device("cuda" if use_cuda else "cpu"),
             )
             logger.info("Prompt Guard model initialized successfully")
         except Exception as e:
             logger.exception("Failed to load model and tokenizer")
             raise RuntimeError(f"Failed to load model and tokenizer: {e!s}")
 
-    def is_injection(self, prompt_text: str, prompt_description: str, threshold: float) -> bool:
-        tokens = self.tokenizer.encode(prompt_text)
-        chunks = [prompt_text] if len(tokens) <= MAX_TOKEN_LENGTH else self._split_prompt_into_chunks(tokens)
+    def get_chunks(self, prompt_text: str, prompt_description: str) -> list[str]:
+        offsets = self.tokenizer(prompt_text, add_special_tokens=False, return_offsets_mapping=True)["offset_mapping"]
+        window_size = MAX_TOKEN_LENGTH - self.tokenizer.num_special_tokens_to_add()
+        chunks = (
+            [prompt_text]
+            if len(offsets) <= window_size
+            else self._split_prompt_into_chunks(prompt_text, offsets, window_size)
+        )
 
         if prompt_description:
             chunks = [f"{prompt_description}{chunk}" for chunk in chunks]
+        return chunks
 
-        results = self.classifier(chunks)
+    def classify(self, chunks: list[str]) -> list[dict]:
+        return self.classifier(chunks, batch_size=min(len(chunks), _max_batch_size))
 
+    @staticmethod
+    def has_injection(chunks: list[str], results: list[dict], threshold: float) -> bool:
         positive_detections = []
         for chunk, result in zip(chunks, results, strict=False):
             if result.get("label", "").lower() != "safe" and result.get("score", 0.0) >= threshold:
@@ -77,16 +96,51 @@ class ProtectAiPromptGuard:
             return True
         return False
 
-    def _split_prompt_into_chunks(self, tokens):
+    @staticmethod
+    def _split_prompt_into_chunks(prompt_text: str, offsets: list[tuple[int, int]], window_size: int) -> list[str]:
+        """Cuts overlapping token windows straight out of the prompt using the tokenizer's character offsets."""
         chunks = []
-        for i in range(0, len(tokens), MAX_TOKEN_LENGTH - SLIDING_WINDOW_SIZE):
-            chunk = tokens[i : (i + MAX_TOKEN_LENGTH)]
-            chunks.append(self.tokenizer.decode(chunk, skip_special_tokens=True))
+        for i in range(0, len(offsets), window_size - SLIDING_WINDOW_SIZE):
+            window = offsets[i : (i + window_size)]
+            chunks.append(prompt_text[window[0][0] : window[-1][1]])
         if len(chunks) > 1 and chunks[-1] in chunks[-2]:
             chunks.pop()
         return chunks
 
 
+async def _classify_batch(chunks_per_check: list[list[str]]) -> list[list[dict]]:
+    """Classifies the chunks of all checks in one call and gives each check the results of its own chunks."""
+    all_chunks = [chunk for chunks in chunks_per_check for chunk in chunks]
+    results = await asyncio.to_thread(ProtectAiPromptGuard.get_instance().classify, all_chunks)
+    results_per_check = []
+    offset = 0
+    for chunks in chunks_per_check:
+        results_per_check.append(results[offset : offset + len(chunks)])
+        offset += len(chunks)
+    return results_per_check
+
+
+# noinspection PyUnusedLocal
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global _pending_checks
+    _pending_checks = asyncio.Queue()
+    batching_task = asyncio.create_task(
+        process_in_micro_batches(_pending_checks, _classify_batch, _max_batch_size, _max_batch_wait_seconds)
+    )
+
+    yield
+
+    if not batching_task.cancel():
+        try:
+            await batching_task
+        except asyncio.CancelledError:
+            logger.info("Prompt guard batching task successfully cancelled.")
+
+
+app = FastAPI(title="Prompt Guard Service", lifespan=lifespan)
+
+
 @app.get("/health")
 def health_check():
     return {"status": "ok"}
@@ -96,7 +150,9 @@ def health_check():
 async def check_injection(request: PromptGuardRequest):
     try:
         guard = ProtectAiPromptGuard.get_instance()
-        is_injection = guard.is_injection(request.prompt, request.prompt_description, request.threshold)
+        chunks = guard.get_chunks(request.prompt, request.prompt_description)
+        results = await submit_to_batch(_pending_checks, chunks)
+        is_injection = guard.has_injection(chunks, results, request.threshold)
         return PromptGuardResponse(is_injection=is_injection)
     except Exception as e:
         logger.exception("Error checking for prompt injection")
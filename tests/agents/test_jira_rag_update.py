@@ -2,7 +2,7 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -15,6 +15,7 @@ def mock_db_service():
     with patch("agents.jira_rag.main.VectorDbService") as MockService:
         mock_instance = MockService.return_value
         mock_instance.upsert = AsyncMock()
+        mock_instance.upsert_many = AsyncMock()
         mock_instance.delete = AsyncMock()
         mock_instance.ensure_collection = AsyncMock()
         mock_instance.client = AsyncMock()
@@ -44,14 +45,30 @@ async def test_upsert_issues(agent):
     result = await agent.upsert_issues(issues)
 
     assert "Upserted 1 issues" in result
-    agent.issues_db.upsert.assert_called_once()
+    agent.issues_db.upsert_many.assert_called_once()
 
     # Verify arguments
-    call_args = agent.issues_db.upsert.call_args
-    # call_args.kwargs['data'] should be a JiraIssue
-    jira_issue = call_args.kwargs["data"]
+    call_args = agent.issues_db.upsert_many.call_args
+    # call_args.kwargs['data'] should be the list of JiraIssues
+    (jira_issue,) = call_args.kwargs["data"]
     assert isinstance(jira_issue, JiraIssue)
     assert jira_issue.id == 1001
     assert jira_issue.key == "TEST-1"
     assert jira_issue.issue_type == "Bug"
     assert jira_issue.project_key == "TEST_PROJ"
+
+
+@pytest.mark.asyncio
+async def test_last_update_timestamp_is_cached(agent):
+    point = MagicMock()
+    point.payload = {"last_update": "2025-01-01T00:00:00Z"}
+    agent.metadata_db.retrieve = AsyncMock(return_value=[point])
+
+    assert await agent.get_last_update_timestamp("TEST_PROJ") == "2025-01-01T00:00:00Z"
+    assert await agent.get_last_update_timestamp("TEST_PROJ") == "2025-01-01T00:00:00Z"
+    agent.metadata_db.retrieve.assert_called_once()
+
+    await agent.save_last_update_timestamp("TEST_PROJ")
+    saved_metadata = agent.metadata_db.upsert.call_args.kwargs["data"]
+    assert await agent.get_last_update_timestamp("TEST_PROJ") == saved_metadata.last_update
+    agent.metadata_db.retrieve.assert_called_once()
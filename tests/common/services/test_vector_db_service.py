@@ -141,6 +141,20 @@ async def test_upsert(vector_db_service, mock_qdrant_client, mock_httpx_client):
     mock_httpx_client.post.assert_called()
 
 
+@pytest.mark.asyncio
+async def test_upsert_many(vector_db_service, mock_qdrant_client, mock_httpx_client):
+    _mock_collections_exist(mock_qdrant_client, "test_collection", exists=True)
+    mock_httpx_client.post.return_value.json.return_value = {"embeddings": [[0.1, 0.2], [0.3, 0.4]]}
+    data = [DummyModel(id="1", content="first"), DummyModel(id="2", content="second")]
+    await vector_db_service.upsert_many(data)
+    mock_httpx_client.post.assert_called_once_with(
+        "http://embedding-service:8080/embed_batch", json={"texts": ["first", "second"]}
+    )
+    mock_qdrant_client.upsert.assert_called_once()
+    points = mock_qdrant_client.upsert.call_args.kwargs["points"]
+    assert [point.id for point in points] == ["1", "2"]
+
+
 @pytest.mark.asyncio
 async def test_delete(vector_db_service, mock_qdrant_client):
     await vector_db_service.delete(["1", "2"])
@@ -0,0 +1,81 @@
+import asyncio
+import contextlib
+from unittest.mock import AsyncMock
+
+import pytest
+
+from common.micro_batching import process_in_micro_batches, submit_to_batch
+
+
+@pytest.fixture
+def process_batch():
+    return AsyncMock(side_effect=lambda items: [item.upper() for item in items])
+
+
+@pytest.fixture
+async def pending_items(process_batch):
+    queue = asyncio.Queue()
+    batching_task = asyncio.create_task(
+        process_in_micro_batches(queue, process_batch, max_batch_size=10, max_batch_wait_seconds=0.01)
+    )
+    yield queue
+    batching_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await batching_task
+
+
+@pytest.mark.asyncio
+async def test_batch_returns_each_item_its_own_result(pending_items, process_batch):
+    results = await asyncio.gather(*(submit_to_batch(pending_items, item) for item in ["a", "b", "c"]))
+
+    assert results == ["A", "B", "C"]
+    process_batch.assert_awaited_once_with(["a", "b", "c"])
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_is_raised_to_every_item(pending_items, process_batch):
+    process_batch.side_effect = RuntimeError("processing failed")
+
+    results = await asyncio.gather(
+        *(submit_to_batch(pending_items, item) for item in ["a", "b"]), return_exceptions=True
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    process_batch.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_result_count_mismatch_is_raised_to_every_item(pending_items, process_batch):
+    process_batch.side_effect = lambda items: ["A"]
+
+    results = await asyncio.gather(
+        *(submit_to_batch(pending_items, item) for item in ["a", "b"]), return_exceptions=True
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_partial_batch_is_flushed_after_wait_time(pending_items, process_batch):
+    async with asyncio.timeout(1):
+        assert await submit_to_batch(pending_items, "a") == "A"
+
+    process_batch.assert_awaited_once_with(["a"])
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_processed_without_waiting(process_batch):
+    queue = asyncio.Queue()
+    batching_task = asyncio.create_task(
+        process_in_micro_batches(queue, process_batch, max_batch_size=2, max_batch_wait_seconds=10)
+    )
+    try:
+        async with asyncio.timeout(1):
+            results = await asyncio.gather(*(submit_to_batch(queue, item) for item in ["a", "b", "c", "d"]))
+    finally:
+        batching_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await batching_task
+
+    assert results == ["A", "B", "C", "D"]
+    assert [call.args[0] for call in process_batch.await_args_list] == [["a", "b"], ["c", "d"]]
@@ -1,10 +1,13 @@
+import asyncio
+import logging
 from datetime import datetime
 from unittest.mock import MagicMock
 
 import pytest
 
 from orchestrator.dashboard_service import OrchestratorDashboardService
-from orchestrator.models import AgentRegistry, ErrorHistory, TaskHistory
+from orchestrator.memory_log_handler import memory_log_handler
+from orchestrator.models import AgentRegistry, ErrorHistory, TaskHistory, TaskRecord, TaskStatus
 
 
 @pytest.fixture
@@ -79,3 +82,83 @@ def test_parse_agent_logs_fallback_timestamp(mock_dashboard_service):
     assert len(parsed) == 1
     # Check that timestamp is empty
     assert parsed[0].timestamp == ""
+
+
+@pytest.mark.asyncio
+async def test_get_summary_reuses_counts_within_ttl():
+    registry = AgentRegistry()
+    tasks = TaskHistory()
+    service = OrchestratorDashboardService(registry, tasks, ErrorHistory(), cache_ttl_seconds=60)
+
+    first = await service.get_summary()
+    await tasks.add(
+        TaskRecord(
+            task_id="t1",
+            agent_id="a1",
+            agent_name="Agent",
+            description="desc",
+            status=TaskStatus.RUNNING,
+            start_time=datetime.now(),
+        )
+    )
+    second = await service.get_summary()
+
+    assert first["tasks_total"] == second["tasks_total"] == 0
+    assert "current_time" in second
+
+    service.cache_ttl_seconds = 0
+    assert (await service.get_summary())["tasks_total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_get_cached_shares_one_rebuild_between_concurrent_callers(mock_dashboard_service):
+    build_count = 0
+
+    async def _build():
+        nonlocal build_count
+        build_count += 1
+        await asyncio.sleep(0.01)
+        return build_count
+
+    results = await asyncio.gather(*(mock_dashboard_service._get_cached("summary", _build) for _ in range(5)))
+
+    assert results == [1] * 5
+    assert build_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_logs_pages_orchestrator_logs_newest_first(mock_dashboard_service):
+    memory_log_handler.clear()
+    for i in range(5):
+        level = logging.ERROR if i % 2 else logging.INFO
+        memory_log_handler.emit(logging.LogRecord("orchestrator", level, __file__, 0, f"message {i}", None, None))
+
+    try:
+        logs = await mock_dashboard_service.get_logs(limit=2, offset=1)
+        assert [log["message"].rsplit(" - ", 1)[-1] for log in logs] == ["message 3", "message 2"]
+
+        error_logs = await mock_dashboard_service.get_logs(limit=10, level="error")
+        assert [log["message"].rsplit(" - ", 1)[-1] for log in error_logs] == ["message 3", "message 1"]
+    finally:
+        memory_log_handler.clear()
+
+
+@pytest.mark.asyncio
+async def test_task_history_drops_evicted_tasks_from_id_index():
+    tasks = TaskHistory(max_size=2)
+    for i in range(3):
+        await tasks.add(
+            TaskRecord(
+                task_id=f"t{i}",
+                agent_id="a1",
+                agent_name="Agent",
+                description="desc",
+                status=TaskStatus.RUNNING,
+                start_time=datetime.now(),
+            )
+        )
+
+    assert [task.task_id for task in await tasks.get_all()] == ["t2", "t1"]
+    assert [task.task_id for task in await tasks.get_recent(1)] == ["t2"]
+    assert await tasks.get_by_id("t0") is None
+    assert (await tasks.get_by_id("t1")).task_id == "t1"
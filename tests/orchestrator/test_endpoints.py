@@ -38,6 +38,25 @@ async def test_review_jira_requirements_endpoint(mock_task_completed):
         mock_send.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_review_jira_requirements_ignores_redelivered_event(mock_task_completed):
+    with (
+        patch("orchestrator.main._jira_events_in_progress", {("/new-requirements-available", "TEST-1")}),
+        patch("orchestrator.main._send_task_to_agent", new_callable=AsyncMock) as mock_send,
+    ):
+        response = client.post("/new-requirements-available", json={"issue_key": "TEST-1"})
+
+        assert response.status_code == 200
+        assert "already running" in response.json()["message"]
+        mock_send.assert_not_called()
+
+        # Other issues are still processed
+        mock_send.return_value = mock_task_completed
+        response = client.post("/new-requirements-available", json={"issue_key": "TEST-2"})
+        assert "completed" in response.json()["message"]
+        mock_send.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_review_jira_requirements_no_issue_key():
     response = client.post("/new-requirements-available", json={})
@@ -76,7 +95,7 @@ async def test_execute_tests_endpoint():
 
     with (
         patch("orchestrator.main.get_test_management_client") as mock_get_client,
-        patch("orchestrator.main._group_test_cases_by_labels", new_callable=AsyncMock) as mock_group,
+        patch("orchestrator.main._group_test_cases_by_labels") as mock_group,
         patch("orchestrator.main._request_all_test_cases_execution", new_callable=AsyncMock) as mock_exec,
         patch("orchestrator.main._generate_test_report", new_callable=AsyncMock) as mock_report,
     ):
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -10,8 +11,10 @@ from orchestrator.main import (
     _discover_agents,
     _fetch_agent_card,
     _select_agent,
+    _select_all_suitable_agent_ids,
     agent_registry,
     discovery_agent,
+    multi_discovery_agent,
 )
 
 
@@ -22,11 +25,13 @@ async def clear_registry():
     agent_registry._statuses.clear()
     agent_registry._broken_reasons.clear()
     agent_registry._stuck_task_ids.clear()
+    agent_registry._ids_by_url.clear()
     yield
     agent_registry._cards.clear()
     agent_registry._statuses.clear()
     agent_registry._broken_reasons.clear()
     agent_registry._stuck_task_ids.clear()
+    agent_registry._ids_by_url.clear()
 
 
 @pytest.fixture
@@ -45,13 +50,10 @@ def mock_agent_card():
 
 @pytest.mark.asyncio
 async def test_fetch_agent_card_success(mock_agent_card):
-    with patch("httpx.AsyncClient") as mock_client_cls:
-        mock_client = AsyncMock()
-        mock_client_cls.return_value.__aenter__.return_value = mock_client
-
+    with patch("orchestrator.main.orchestrator_http_client", new_callable=AsyncMock) as mock_client:
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = mock_agent_card.model_dump()
+        mock_response.content = mock_agent_card.model_dump_json().encode()
         mock_client.get.return_value = mock_response
 
         card = await _fetch_agent_card("http://localhost:8001")
@@ -60,10 +62,7 @@ async def test_fetch_agent_card_success(mock_agent_card):
 
 @pytest.mark.asyncio
 async def test_fetch_agent_card_failure():
-    with patch("httpx.AsyncClient") as mock_client_cls:
-        mock_client = AsyncMock()
-        mock_client_cls.return_value.__aenter__.return_value = mock_client
-
+    with patch("orchestrator.main.orchestrator_http_client", new_callable=AsyncMock) as mock_client:
         mock_client.get.side_effect = Exception("Connection error")
 
         card = await _fetch_agent_card("http://bad-url")
@@ -76,6 +75,7 @@ async def test_discover_agents_success(clear_registry, mock_agent_card):
         patch("config.OrchestratorConfig.REMOTE_EXECUTION_AGENT_HOSTS", "http://localhost"),
         patch("config.OrchestratorConfig.AGENT_DISCOVERY_PORTS", "8001-8001"),
         patch("orchestrator.main._fetch_agent_card", return_value=mock_agent_card),
+        patch("orchestrator.main._is_port_open", return_value=True),
     ):
         await _discover_agents()
 
@@ -102,6 +102,68 @@ async def test_select_agent(clear_registry, mock_agent_card):
         assert agent_id == "test-id"
 
 
+@pytest.mark.asyncio
+async def test_select_all_suitable_agent_ids_reuses_selection(clear_registry, mock_agent_card):
+    await agent_registry.register("test-id", mock_agent_card)
+
+    mock_result = MagicMock()
+    mock_result.output.ids = ["test-id"]
+
+    with (
+        patch("orchestrator.main._agent_selection_cache", {}),
+        patch.object(multi_discovery_agent, "run", new_callable=AsyncMock) as mock_run,
+    ):
+        mock_run.return_value = mock_result
+
+        assert await _select_all_suitable_agent_ids("Execute UI tests") == ["test-id"]
+        assert await _select_all_suitable_agent_ids("Execute UI tests") == ["test-id"]
+        mock_run.assert_called_once()
+
+        # A registry change invalidates earlier selections
+        await agent_registry.register("other-id", mock_agent_card.model_copy(update={"url": "http://localhost:8002"}))
+        await _select_all_suitable_agent_ids("Execute UI tests")
+        assert mock_run.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_select_all_suitable_agent_ids_does_not_cache_empty_selection(clear_registry, mock_agent_card):
+    await agent_registry.register("test-id", mock_agent_card)
+
+    mock_result = MagicMock()
+    mock_result.output.ids = []
+
+    with (
+        patch("orchestrator.main._agent_selection_cache", {}),
+        patch.object(multi_discovery_agent, "run", new_callable=AsyncMock) as mock_run,
+    ):
+        mock_run.return_value = mock_result
+
+        assert await _select_all_suitable_agent_ids("Execute UI tests") == []
+        assert await _select_all_suitable_agent_ids("Execute UI tests") == []
+        assert mock_run.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_select_all_suitable_agent_ids_prunes_expired_selections(clear_registry, mock_agent_card):
+    await agent_registry.register("test-id", mock_agent_card)
+
+    mock_result = MagicMock()
+    mock_result.output.ids = ["test-id"]
+    selection_cache = {}
+
+    with (
+        patch("orchestrator.main._agent_selection_cache", selection_cache),
+        patch("config.OrchestratorConfig.AGENT_SELECTION_CACHE_TTL_SECONDS", 0),
+        patch.object(multi_discovery_agent, "run", new_callable=AsyncMock) as mock_run,
+    ):
+        mock_run.return_value = mock_result
+
+        await _select_all_suitable_agent_ids("Execute UI tests")
+        await _select_all_suitable_agent_ids("Execute API tests")
+
+        assert [key[2] for key in selection_cache] == ["Execute API tests"]
+
+
 @pytest.mark.asyncio
 async def test_select_agent_none_found(clear_registry):
     agent_id = await _select_agent("some task", [])
@@ -175,6 +237,7 @@ async def test_discover_agents_fetches_new(clear_registry, mock_agent_card):
         patch("config.OrchestratorConfig.REMOTE_EXECUTION_AGENT_HOSTS", "http://localhost"),
         patch("config.OrchestratorConfig.AGENT_DISCOVERY_PORTS", "8001-8001"),
         patch("orchestrator.main._fetch_agent_card", return_value=mock_agent_card) as mock_fetch,
+        patch("orchestrator.main._is_port_open", return_value=True),
     ):
         await _discover_agents()
 
@@ -183,3 +246,57 @@ async def test_discover_agents_fetches_new(clear_registry, mock_agent_card):
 
         # Verify new agent registered
         assert not await agent_registry.is_empty()
+
+
+@pytest.mark.asyncio
+async def test_discover_agents_bounds_concurrency(clear_registry):
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _fake_process(url, known_agent_ids_by_url):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    with (
+        patch("config.OrchestratorConfig.REMOTE_EXECUTION_AGENT_HOSTS", "http://localhost"),
+        patch("config.OrchestratorConfig.AGENT_DISCOVERY_PORTS", "8001-8010"),
+        patch("config.OrchestratorConfig.AGENT_DISCOVERY_CONCURRENCY", 3),
+        patch("orchestrator.main._process_url_discovery", side_effect=_fake_process) as mock_process,
+    ):
+        await _discover_agents()
+
+        assert mock_process.call_count == 10
+        assert max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_discover_agents_registers_shared_card_once(clear_registry, mock_agent_card):
+    # Several probed ports answer with the same advertised card URL
+    with (
+        patch("config.OrchestratorConfig.REMOTE_EXECUTION_AGENT_HOSTS", "http://localhost"),
+        patch("config.OrchestratorConfig.AGENT_DISCOVERY_PORTS", "8001-8005"),
+        patch("orchestrator.main._fetch_agent_card", return_value=mock_agent_card) as mock_fetch,
+        patch("orchestrator.main._is_port_open", return_value=True),
+    ):
+        await _discover_agents()
+
+        assert mock_fetch.call_count == 5
+        assert len(await agent_registry.get_all_cards()) == 1
+
+
+@pytest.mark.asyncio
+async def test_discover_agents_skips_closed_ports(clear_registry, mock_agent_card):
+    with (
+        patch("config.OrchestratorConfig.REMOTE_EXECUTION_AGENT_HOSTS", "http://localhost"),
+        patch("config.OrchestratorConfig.AGENT_DISCOVERY_PORTS", "8001-8001"),
+        patch("orchestrator.main._fetch_agent_card", return_value=mock_agent_card) as mock_fetch,
+        patch("orchestrator.main._is_port_open", return_value=False) as mock_probe,
+    ):
+        await _discover_agents()
+
+        mock_probe.assert_called_once_with("http://localhost:8001")
+        mock_fetch.assert_not_called()
+        assert await agent_registry.is_empty()
@@ -1,12 +1,17 @@
 import asyncio
-import contextlib
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from a2a.types import Artifact, TaskState, TaskStatus, TextPart
 
 from common.models import TestCase, TestExecutionResult
-from orchestrator.main import AgentStatus, _agent_worker, _execute_single_test
+from orchestrator.main import (
+    AgentStatus,
+    _agent_worker,
+    _execute_single_test,
+    _request_all_test_cases_execution,
+    _request_incident_creation_for_failed_tests,
+)
 
 
 @pytest.fixture
@@ -14,6 +19,7 @@ def mock_registry():
     with patch("orchestrator.main.agent_registry") as mock:
         mock.get_name = AsyncMock(return_value="Agent 1")
         mock.get_status = AsyncMock(return_value=AgentStatus.AVAILABLE)
+        mock.wait_for_status = AsyncMock(return_value=AgentStatus.AVAILABLE)
         yield mock
 
 
@@ -28,7 +34,7 @@ def mock_queue():
 
 @pytest.mark.asyncio
 async def test_agent_worker_success(mock_registry, mock_queue):
-    mock_registry.get_status.side_effect = [AgentStatus.AVAILABLE, AgentStatus.AVAILABLE]
+    mock_registry.wait_for_status.side_effect = [AgentStatus.AVAILABLE, AgentStatus.AVAILABLE]
 
     test_case = TestCase(
         key="TC-1",
@@ -55,20 +61,17 @@ async def test_agent_worker_success(mock_registry, mock_queue):
             end_timestamp="then",
         )
 
-        results = []
-        with contextlib.suppress(asyncio.CancelledError):
-            await _agent_worker("agent-1", mock_queue, results, ["agent-1"])
+        results = await _agent_worker("agent-1", mock_queue, ["agent-1"])
 
         assert len(results) == 1
-        mock_exec.assert_called_once()
-        mock_registry.get_status.assert_called()
+        mock_exec.assert_called_once_with("Agent 1", test_case, "UI")
+        mock_registry.wait_for_status.assert_called()
 
 
 @pytest.mark.asyncio
 async def test_agent_worker_broken(mock_registry, mock_queue):
-    mock_registry.get_status.return_value = AgentStatus.BROKEN
-    results = []
-    await _agent_worker("agent-1", mock_queue, results, ["agent-1"])
+    mock_registry.wait_for_status.return_value = AgentStatus.BROKEN
+    results = await _agent_worker("agent-1", mock_queue, ["agent-1"])
     assert len(results) == 0
 
 
@@ -114,7 +117,125 @@ async def test_execute_single_test_success(mock_registry):
         )
         mock_extractor_instance.run = AsyncMock(return_value=mock_run_result)
 
-        result = await _execute_single_test("agent-1", test_case, "UI")
+        result = await _execute_single_test("Agent 1", test_case, "UI")
 
         assert result.testExecutionStatus == "passed"
         assert result.testCaseKey == "TC-1"
+
+
+@pytest.mark.asyncio
+async def test_request_all_test_cases_execution_cancels_groups_past_deadline():
+    fast_result = MagicMock()
+
+    async def _fake_execute_group(label, test_cases, agent_ids):
+        if label == "slow":
+            await asyncio.sleep(10)
+        return [fast_result]
+
+    with (
+        patch(
+            "orchestrator.main._select_execution_agents_for_each_test_label",
+            new_callable=AsyncMock,
+            return_value={"fast": ["agent-1"], "slow": ["agent-2"]},
+        ),
+        patch("orchestrator.main._execute_test_group", side_effect=_fake_execute_group),
+        patch("orchestrator.main.config.OrchestratorConfig.TEST_GROUP_EXECUTION_TIMEOUT_SECONDS", 0.1),
+        patch("orchestrator.main._record_error") as mock_record_error,
+    ):
+        results = await _request_all_test_cases_execution({"fast": [MagicMock()], "slow": [MagicMock()]})
+
+    assert results == [fast_result]
+    mock_record_error.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_request_all_test_cases_execution_cancels_groups_when_cancelled():
+    all_groups_started = asyncio.Event()
+    started_labels = []
+    cancelled_labels = []
+
+    async def _fake_execute_group(label, test_cases, agent_ids):
+        try:
+            started_labels.append(label)
+            if len(started_labels) == 2:
+                all_groups_started.set()
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled_labels.append(label)
+            raise
+
+    with (
+        patch(
+            "orchestrator.main._select_execution_agents_for_each_test_label",
+            new_callable=AsyncMock,
+            return_value={"first": ["agent-1"], "second": ["agent-2"]},
+        ),
+        patch("orchestrator.main._execute_test_group", side_effect=_fake_execute_group),
+    ):
+        execution = asyncio.create_task(
+            _request_all_test_cases_execution({"first": [MagicMock()], "second": [MagicMock()]})
+        )
+        await all_groups_started.wait()
+        execution.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await execution
+
+    assert sorted(cancelled_labels) == ["first", "second"]
+
+
+@pytest.mark.asyncio
+async def test_request_incident_creation_for_failed_tests_bounds_concurrency():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _fake_request_incident_creation(incident_input, artifacts):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    failed_results = [MagicMock(testExecutionStatus="failed", artifacts=[]) for _ in range(10)]
+
+    with (
+        patch("orchestrator.main.IncidentCreationInput"),
+        patch(
+            "orchestrator.main._request_incident_creation", side_effect=_fake_request_incident_creation
+        ) as mock_request,
+        patch("orchestrator.main._incident_creation_semaphore", asyncio.Semaphore(3)),
+    ):
+        await _request_incident_creation_for_failed_tests(failed_results)
+
+    assert mock_request.call_count == 10
+    assert max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_request_incident_creation_for_failed_tests_bounds_concurrency_across_runs():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _fake_request_incident_creation(incident_input, artifacts):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    first_run_results = [MagicMock(testExecutionStatus="failed", artifacts=[]) for _ in range(5)]
+    second_run_results = [MagicMock(testExecutionStatus="failed", artifacts=[]) for _ in range(5)]
+
+    with (
+        patch("orchestrator.main.IncidentCreationInput"),
+        patch(
+            "orchestrator.main._request_incident_creation", side_effect=_fake_request_incident_creation
+        ) as mock_request,
+        patch("orchestrator.main._incident_creation_semaphore", asyncio.Semaphore(3)),
+    ):
+        await asyncio.gather(
+            _request_incident_creation_for_failed_tests(first_run_results),
+            _request_incident_creation_for_failed_tests(second_run_results),
+        )
+
+    assert mock_request.call_count == 10
+    assert max_in_flight == 3
@@ -563,6 +563,44 @@ class TestRequestTestCasesGenerationErrorHandling:
 class TestExecuteSingleTestMultipleTextParts:
     """Tests for _execute_single_test handling of multiple text parts."""
 
+    @pytest.mark.asyncio
+    async def test_parses_schema_conforming_result_without_extractor(self, mock_error_history):
+        """Test that a response already matching TestExecutionResult skips the LLM extractor."""
+        from common.models import TestCase
+
+        test_case = TestCase(
+            key="TC-003",
+            labels=["api"],
+            name="API Test",
+            summary="Test API",
+            comment="",
+            preconditions="",
+            steps=[],
+            parent_issue_key="STORY-3",
+        )
+
+        artifact = _create_text_artifact(
+            [
+                '{"stepResults": [], "testCaseKey": "TC-003", "testCaseName": "API Test", ',
+                '"testExecutionStatus": "passed", "generalErrorMessage": "", '
+                '"start_timestamp": "2025-01-01", "end_timestamp": "2025-01-01"}',
+            ]
+        )
+
+        with (
+            patch("orchestrator.main._send_task_to_agent", new_callable=AsyncMock),
+            patch("orchestrator.main._get_artifacts_from_task", return_value=[artifact]),
+            patch("orchestrator.main._get_results_extractor_agent") as mock_extractor,
+        ):
+            from orchestrator.main import _execute_single_test
+
+            result = await _execute_single_test("Test Agent", test_case, "api")
+
+            mock_extractor.assert_not_called()
+            assert result.testExecutionStatus == "passed"
+            assert result.start_timestamp == "2025-01-01"
+            assert result.test_case == test_case
+
     @pytest.mark.asyncio
     async def test_joins_multiple_text_parts(self, mock_error_history):
         """Test that _execute_single_test joins multiple text parts correctly."""
@@ -579,10 +617,10 @@ class TestExecuteSingleTestMultipleTextParts:
             parent_issue_key="STORY-1",
         )
 
-        # Create artifact with multiple text parts
+        # Create artifact with multiple text parts that don't form a valid result on their own
         multi_part_artifact = _create_text_artifact(
             [
-                '{"stepResults": [], "testCaseKey": "TC-001", ',
+                'Execution report: {"stepResults": [], "testCaseKey": "TC-001", ',
                 '"testCaseName": "Test Case", "testExecutionStatus": "passed", ',
                 '"generalErrorMessage": "", "start_timestamp": "2025-01-01", "end_timestamp": "2025-01-01"}',
             ]
@@ -619,7 +657,7 @@ class TestExecuteSingleTestMultipleTextParts:
 
             from orchestrator.main import _execute_single_test
 
-            await _execute_single_test("agent-1", test_case, "ui")
+            await _execute_single_test("Test Agent", test_case, "ui")
 
             # Verify that the extractor was called with joined text parts
             mock_extractor_instance.run.assert_called_once()
@@ -678,7 +716,7 @@ class TestExecuteSingleTestMultipleTextParts:
 
             from orchestrator.main import _execute_single_test
 
-            result = await _execute_single_test("agent-1", test_case, "api")
+            result = await _execute_single_test("Test Agent", test_case, "api")
 
             assert result is not None
             assert result.testExecutionStatus == "failed"
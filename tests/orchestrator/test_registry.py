@@ -84,6 +84,21 @@ async def test_remove(registry, sample_card):
     assert not await registry.contains(agent_id)
 
 
+@pytest.mark.asyncio
+async def test_version_changes_on_card_mutation(registry, sample_card):
+    initial_version = registry.version
+
+    await registry.register("agent-1", sample_card)
+    registered_version = registry.version
+    assert registered_version != initial_version
+
+    await registry.update_status("agent-1", AgentStatus.BUSY)
+    assert registry.version == registered_version
+
+    await registry.remove("agent-1")
+    assert registry.version != registered_version
+
+
 @pytest.mark.asyncio
 async def test_get_valid_agents(registry, sample_card):
     await registry.register("a1", sample_card)
@@ -103,6 +118,72 @@ async def test_is_empty(registry, sample_card):
     assert not await registry.is_empty()
 
 
+@pytest.mark.asyncio
+async def test_get_names(registry, sample_card):
+    await registry.register("a1", sample_card)
+    await registry.register("a2", sample_card)
+
+    assert await registry.get_names(["a1", "missing", "a2"]) == {"a1": "Test Agent", "a2": "Test Agent"}
+
+
+@pytest.mark.asyncio
+async def test_get_statuses(registry, sample_card):
+    await registry.register("a1", sample_card)
+    await registry.register("a2", sample_card)
+    await registry.update_status("a2", AgentStatus.BUSY)
+
+    assert await registry.get_statuses(["a1", "a2", "missing"]) == {
+        "a1": AgentStatus.AVAILABLE,
+        "a2": AgentStatus.BUSY,
+        "missing": AgentStatus.BROKEN,
+    }
+
+
+@pytest.mark.asyncio
+async def test_wait_for_status_wakes_on_update(registry, sample_card):
+    await registry.register("a1", sample_card)
+    await registry.update_status("a1", AgentStatus.BUSY)
+
+    waiter = asyncio.create_task(registry.wait_for_status("a1", (AgentStatus.AVAILABLE, AgentStatus.BROKEN)))
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    await registry.update_status("a1", AgentStatus.AVAILABLE)
+    assert await asyncio.wait_for(waiter, timeout=1) == AgentStatus.AVAILABLE
+
+
+@pytest.mark.asyncio
+async def test_release_agent_clears_current_task(registry, sample_card):
+    await registry.register("a1", sample_card)
+    await registry.update_status("a1", AgentStatus.BUSY)
+    await registry.set_current_task("a1", "task-1")
+
+    await registry.release_agent("a1", AgentStatus.BROKEN, BrokenReason.TASK_STUCK, "remote-task-1")
+
+    assert await registry.get_status("a1") == AgentStatus.BROKEN
+    assert await registry.get_current_task("a1") is None
+    assert await registry.get_broken_context("a1") == (BrokenReason.TASK_STUCK, "remote-task-1")
+
+
+@pytest.mark.asyncio
+async def test_wait_for_other_available_agent_ignores_excluded_agents(registry, sample_card):
+    await registry.register("a1", sample_card)
+    await registry.register("a2", sample_card.model_copy(update={"url": "http://localhost:8001"}))
+    await registry.update_status("a2", AgentStatus.BUSY)
+
+    waiter = asyncio.create_task(registry.wait_for_other_available_agent({"a1"}))
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    await registry.update_status("a1", AgentStatus.BUSY)
+    await registry.update_status("a1", AgentStatus.AVAILABLE)
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    await registry.update_status("a2", AgentStatus.AVAILABLE)
+    await asyncio.wait_for(waiter, timeout=1)
+
+
 @pytest.mark.asyncio
 async def test_get_agent_id_by_url(registry, sample_card):
     """Test looking up agent by URL."""
@@ -117,6 +198,19 @@ async def test_get_agent_id_by_url(registry, sample_card):
     assert not_found is None
 
 
+@pytest.mark.asyncio
+async def test_url_index_follows_card_changes(registry, sample_card):
+    """Test that the URL index is updated when a card is replaced or removed."""
+    await registry.register("agent-1", sample_card)
+    moved_card = sample_card.model_copy(update={"url": "http://localhost:9000"})
+
+    await registry.register("agent-1", moved_card)
+    assert await registry.get_agent_ids_by_url() == {"http://localhost:9000": "agent-1"}
+
+    await registry.remove("agent-1")
+    assert await registry.get_agent_id_by_url("http://localhost:9000") is None
+
+
 @pytest.mark.asyncio
 async def test_get_broken_agents(registry, sample_card):
     """Test getting all broken agents with their context."""
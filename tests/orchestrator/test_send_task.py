@@ -1,14 +1,19 @@
 import asyncio
 import contextlib
+import random
 import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from a2a.types import JSONRPCErrorResponse, Message, Task, TaskState, TaskStatus
 
+import config
 from orchestrator.main import (
     AgentStatus,
     BrokenReason,
+    CancellationRequest,
+    _enqueue_agent_recovery,
+    _get_recovery_retry_delay,
     _retry_cancellation_task,
     _send_task_to_agent,
     cancellation_queue,
@@ -30,6 +35,7 @@ def mock_registry():
         mock.get_valid_agents = AsyncMock()
         mock.get_broken_context = AsyncMock(return_value=(None, None))
         mock.set_current_task = AsyncMock()
+        mock.release_agent = AsyncMock()
         yield mock
 
 
@@ -58,7 +64,7 @@ async def test_send_task_success(mock_registry):
 
         assert task.status.state == TaskState.completed
         # _wait_and_reserve_agent handles reservation, so we just check if registry was updated by the main flow (e.g. releasing agent)
-        mock_registry.update_status.assert_any_call("agent-1", AgentStatus.AVAILABLE)
+        mock_registry.release_agent.assert_any_call("agent-1", AgentStatus.AVAILABLE)
 
 
 @pytest.mark.asyncio
@@ -88,21 +94,48 @@ async def test_send_task_timeout(mock_registry):
             await _send_task_to_agent("input", "desc")
 
         assert exc.value.status_code == 408
-        # Check that update_status was called with BROKEN status and TASK_STUCK reason
+        # Check that the agent was released with BROKEN status and TASK_STUCK reason
         # The call should include agent_id, status, broken_reason, and optionally stuck_task_id
         broken_calls = [
             c
-            for c in mock_registry.update_status.call_args_list
+            for c in mock_registry.release_agent.call_args_list
             if len(c.args) >= 2 and c.args[1] == AgentStatus.BROKEN
         ]
         assert len(broken_calls) > 0, "Expected at least one call with AgentStatus.BROKEN"
 
 
+@pytest.mark.asyncio
+async def test_send_task_caller_cancelled_releases_agent(mock_registry):
+    with (
+        patch("orchestrator.main.ClientFactory") as mock_factory_cls,
+        patch("orchestrator.main.reserve_agent_waiting_if_needed", new_callable=AsyncMock) as mock_reserve,
+    ):
+        mock_reserve.return_value = ("agent-1", MagicMock())
+        mock_a2a_client = MagicMock()
+        mock_factory_cls.return_value.create.return_value = mock_a2a_client
+        stream_started = asyncio.Event()
+
+        async def response_generator():
+            stream_started.set()
+            await asyncio.sleep(10)
+            yield None
+
+        mock_a2a_client.send_message.return_value = response_generator()
+
+        send_task = asyncio.create_task(_send_task_to_agent("input", "desc"))
+        await stream_started.wait()
+        send_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await send_task
+
+        mock_registry.release_agent.assert_called_with("agent-1", AgentStatus.AVAILABLE)
+
+
 @pytest.mark.asyncio
 async def test_cancellation_task_offline_recovery(mock_registry):
     """Test that OFFLINE agents can be recovered when they respond to card fetch."""
     # Setup queue with one item
-    await cancellation_queue.put(("agent-1", time.time()))
+    await cancellation_queue.put(CancellationRequest("agent-1", time.monotonic()))
 
     mock_registry.get_card.return_value = MagicMock(url="http://agent")
     # Simulate OFFLINE agent
@@ -130,7 +163,7 @@ async def test_cancellation_task_offline_recovery(mock_registry):
 async def test_cancellation_task_retry(mock_registry):
     """Test that agents that fail recovery check are re-queued for retry."""
     # Setup queue
-    await cancellation_queue.put(("agent-1", time.time()))
+    await cancellation_queue.put(CancellationRequest("agent-1", time.monotonic()))
 
     mock_registry.get_card.return_value = MagicMock(url="http://agent")
     # Simulate OFFLINE agent that is still offline
@@ -157,11 +190,40 @@ async def test_cancellation_task_retry(mock_registry):
         assert len(available_calls) == 0, "Agent should not be marked AVAILABLE when still offline"
 
 
+@pytest.mark.asyncio
+async def test_cancellation_task_retry_does_not_block_other_agents(mock_registry):
+    """Test that a pending retry for one agent doesn't delay recovery of the next queued agent."""
+    await cancellation_queue.put(CancellationRequest("agent-1", time.monotonic()))
+    await cancellation_queue.put(CancellationRequest("agent-2", time.monotonic()))
+
+    mock_registry.get_card.return_value = MagicMock(url="http://agent")
+    mock_registry.get_broken_context.return_value = (BrokenReason.OFFLINE, None)
+
+    with (
+        patch("orchestrator.main._fetch_agent_card", new_callable=AsyncMock) as mock_fetch,
+        # Keep agent-1's jittered retry outside the test window
+        patch("orchestrator.main._get_recovery_retry_delay", return_value=60),
+    ):
+        # agent-1 is still offline, agent-2 is back
+        mock_fetch.side_effect = [False, True]
+
+        task = asyncio.create_task(_retry_cancellation_task())
+
+        await asyncio.sleep(0.1)
+
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+        mock_registry.update_status.assert_called_with("agent-2", AgentStatus.AVAILABLE)
+        assert cancellation_queue.empty()
+
+
 @pytest.mark.asyncio
 async def test_cancellation_task_stuck_with_cancel(mock_registry):
     """Test that TASK_STUCK agents trigger task cancellation before recovery."""
     # Setup queue
-    await cancellation_queue.put(("agent-1", time.time()))
+    await cancellation_queue.put(CancellationRequest("agent-1", time.monotonic()))
 
     mock_registry.get_card.return_value = MagicMock(url="http://agent")
     # Simulate TASK_STUCK agent with a known task ID
@@ -181,3 +243,30 @@ async def test_cancellation_task_stuck_with_cancel(mock_registry):
         # Should have attempted to cancel the stuck task
         mock_cancel.assert_called_once()
         mock_registry.update_status.assert_called_with("agent-1", AgentStatus.AVAILABLE)
+
+
+def test_recovery_retry_delay_uses_capped_full_jitter():
+    random.seed(42)
+    base = config.RetryConfig.AGENT_RECOVERY_RETRY_BASE_DELAY_SECONDS
+    max_delay = config.RetryConfig.AGENT_RECOVERY_RETRY_MAX_DELAY_SECONDS
+
+    for attempt in range(4):
+        assert 0 <= _get_recovery_retry_delay(attempt) <= base * 2**attempt
+    delays = [_get_recovery_retry_delay(100) for _ in range(50)]
+    assert all(0 <= d <= max_delay for d in delays)
+    assert len(set(delays)) > 1
+
+
+@pytest.mark.asyncio
+async def test_enqueue_agent_recovery_coalesces_duplicates():
+    queue = asyncio.Queue()
+    with (
+        patch("orchestrator.main.cancellation_queue", queue),
+        patch("orchestrator.main._agents_pending_recovery", set()) as pending,
+    ):
+        _enqueue_agent_recovery("agent-1")
+        _enqueue_agent_recovery("agent-1")
+        _enqueue_agent_recovery("agent-2")
+
+        assert queue.qsize() == 2
+        assert pending == {"agent-1", "agent-2"}
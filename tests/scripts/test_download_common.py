@@ -0,0 +1,28 @@
+import pytest
+
+from scripts._download_common import is_model_saved
+
+
+@pytest.mark.parametrize("weights_file_name", ["model.safetensors", "pytorch_model.bin.index.json"])
+def test_is_model_saved_with_config_and_weights(tmp_path, weights_file_name):
+    (tmp_path / "config.json").write_text("{}")
+    (tmp_path / weights_file_name).write_text("")
+
+    assert is_model_saved(str(tmp_path))
+
+
+def test_is_model_saved_without_weights(tmp_path):
+    # An interrupted save leaves config.json behind without the weights
+    (tmp_path / "config.json").write_text("{}")
+
+    assert not is_model_saved(str(tmp_path))
+
+
+def test_is_model_saved_without_config(tmp_path):
+    (tmp_path / "model.safetensors").write_text("")
+
+    assert not is_model_saved(str(tmp_path))
+
+
+def test_is_model_saved_for_missing_directory(tmp_path):
+    assert not is_model_saved(str(tmp_path / "missing"))
@@ -0,0 +1,46 @@
+import runpy
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+@pytest.fixture
+def mock_sentence_transformers():
+    mock = MagicMock()
+    with patch.dict(sys.modules, {"sentence_transformers": mock}):
+        yield mock
+
+
+@pytest.fixture
+def mock_config():
+    mock = MagicMock()
+    mock.QdrantConfig.EMBEDDING_MODEL = "model-name"
+    mock.QdrantConfig.EMBEDDING_MODEL_PATH = "models/embedding"
+    with patch.dict(sys.modules, {"config": mock}):
+        yield mock
+
+
+def test_download(mock_sentence_transformers, mock_config):
+    mock_model = MagicMock()
+    mock_sentence_transformers.SentenceTransformer.return_value = mock_model
+
+    with (
+        patch("os.path.exists", return_value=False),
+        patch("os.makedirs") as mock_makedirs,
+    ):
+        runpy.run_module("scripts.download_embedding_model", run_name="__main__")
+
+        mock_makedirs.assert_called_with("models/embedding")
+        mock_sentence_transformers.SentenceTransformer.assert_called_with("model-name", trust_remote_code=True)
+        mock_model.save.assert_called_with("models/embedding")
+
+
+def test_download_skipped_when_model_present(mock_sentence_transformers, mock_config):
+    with (
+        patch("scripts._download_common.is_model_saved", return_value=True),
+        pytest.raises(SystemExit),
+    ):
+        runpy.run_module("scripts.download_embedding_model", run_name="__main__")
+
+    mock_sentence_transformers.SentenceTransformer.assert_not_called()
@@ -1,4 +1,3 @@
-import os
 import runpy
 import sys
 from unittest.mock import MagicMock, patch
@@ -55,3 +54,17 @@ def test_download_disabled(mock_transformers):
 
         # Verify NO interactions
         mock_transformers.AutoTokenizer.from_pretrained.assert_not_called()
+
+
+def test_download_skipped_when_model_present(mock_transformers):
+    mock_config = MagicMock()
+    mock_config.PROMPT_INJECTION_CHECK_ENABLED = True
+
+    with (
+        patch.dict(sys.modules, {"config": mock_config}),
+        patch("scripts._download_common.is_model_saved", return_value=True),
+    ):
+        runpy.run_module("scripts.download_prompt_guard_model", run_name="__main__")
+
+        mock_transformers.AutoTokenizer.from_pretrained.assert_not_called()
+        mock_transformers.AutoModelForSequenceClassification.from_pretrained.assert_not_called()
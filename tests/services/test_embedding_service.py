@@ -0,0 +1,59 @@
+import asyncio
+import contextlib
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from common.micro_batching import process_in_micro_batches, submit_to_batch
+from services.embedding_service.main import _run_on_encode_thread
+
+
+@pytest.fixture
+def mock_model():
+    with patch("services.embedding_service.main._get_embedding_model") as mock_get_model:
+        yield mock_get_model.return_value
+
+
+@pytest.mark.asyncio
+async def test_batch_returns_each_request_its_own_embedding(mock_model):
+    mock_model.encode.side_effect = lambda texts, **kwargs: [[float(len(text))] for text in texts]
+    pending_texts = asyncio.Queue()
+    batching_task = asyncio.create_task(
+        process_in_micro_batches(pending_texts, _run_on_encode_thread, max_batch_size=10, max_batch_wait_seconds=0.01)
+    )
+    try:
+        results = await asyncio.gather(*(submit_to_batch(pending_texts, text) for text in ["a", "bb", "ccc"]))
+    finally:
+        batching_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await batching_task
+
+    assert results == [[1.0], [2.0], [3.0]]
+    mock_model.encode.assert_called_once()
+    assert mock_model.encode.call_args.args[0] == ["a", "bb", "ccc"]
+
+
+@pytest.mark.asyncio
+async def test_encode_calls_run_one_at_a_time(mock_model):
+    in_flight = 0
+    max_in_flight = 0
+    counter_lock = threading.Lock()
+
+    def _fake_encode(texts, **kwargs):
+        nonlocal in_flight, max_in_flight
+        with counter_lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.01)
+        with counter_lock:
+            in_flight -= 1
+        return [[0.5] for _ in texts]
+
+    mock_model.encode.side_effect = _fake_encode
+
+    await asyncio.gather(*(_run_on_encode_thread(["a"]) for _ in range(5)))
+
+    assert mock_model.encode.call_count == 5
+    assert max_in_flight == 1
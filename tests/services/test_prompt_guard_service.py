@@ -0,0 +1,25 @@
+from unittest.mock import patch
+
+import pytest
+
+from services.prompt_guard_service.main import _classify_batch
+
+
+@pytest.fixture
+def mock_guard():
+    with patch("services.prompt_guard_service.main.ProtectAiPromptGuard.get_instance") as mock_get_instance:
+        yield mock_get_instance.return_value
+
+
+@pytest.mark.asyncio
+async def test_batch_returns_each_check_the_results_of_its_own_chunks(mock_guard):
+    mock_guard.classify.side_effect = lambda chunks: [{"label": chunk, "score": 1.0} for chunk in chunks]
+
+    results = await _classify_batch([["a1", "a2"], ["b1"], ["c1", "c2", "c3"]])
+
+    assert [[result["label"] for result in check_results] for check_results in results] == [
+        ["a1", "a2"],
+        ["b1"],
+        ["c1", "c2", "c3"],
+    ]
+    mock_guard.classify.assert_called_once_with(["a1", "a2", "b1", "c1", "c2", "c3"])